@@ -0,0 +1,88 @@
+"""API 응답 JSON 디코더 벤치마크
+
+응답 페이지 하나를 json / orjson / msgspec 백엔드와 필드 투영(project_fields)
+조합별로 반복 디코딩해 페이지당 시간과 공고 1건당 메모리를 비교합니다.
+기본 입력은 저장소에 포함된 fixtures/bid_page.json.gz로, 실제 응답을 녹화한 것이 아니라 응답과 같은
+구조·필드로 만든 합성 페이지(용역 공고 999건)입니다. API 키 없이도 같은 조건으로 다시 측정할 수 있지만,
+실제 데이터에서의 수치는 --cached로 확인하세요.
+
+    python bench_decode.py                   # fixtures/bid_page.json.gz 사용
+    python bench_decode.py --cached          # http_cache에 가장 최근에 캐시된 실제 응답 사용
+    python bench_decode.py path/to/page.json.gz --repeat 50
+"""
+
+import argparse
+import gc
+import gzip
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import scraper
+
+BACKENDS = ["json", "orjson", "msgspec"]
+FIXTURE = Path(__file__).parent / "fixtures" / "bid_page.json.gz"
+
+
+def load_page(path: Path | None, cached: bool = False) -> bytes:
+    if path is None and cached:
+        cache_dir = scraper.configure_http_cache(scraper.load_config())
+        pages = sorted(cache_dir.rglob("*.json.gz"), key=lambda p: p.stat().st_mtime) if cache_dir else []
+        if not pages:
+            sys.exit("기록된 응답이 없습니다. http_cache를 켜고 scraper.py를 먼저 실행하세요.")
+        path = pages[-1]
+    elif path is None:
+        path = FIXTURE
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def bench(raw: bytes, backend: str, project: bool, repeat: int) -> tuple[float, int, float] | None:
+    """Return (seconds per page, items per page, retained bytes per item) or None if unavailable."""
+    scraper.configure_json_decoder({"json_backend": backend, "project_fields": project})
+    if scraper._json_backend != backend:
+        return None
+
+    code, message, body = scraper._parse_page(raw)
+    if code != "00":
+        sys.exit(f"정상 응답이 아닙니다: {code} {message}")
+    items = len(body.get("items") or [])
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scraper._parse_page(raw)
+    per_page = (time.perf_counter() - start) / repeat
+
+    gc.collect()
+    tracemalloc.start()
+    result = scraper._parse_page(raw)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return per_page, items, retained / max(items, 1)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="API 응답 JSON 디코더 벤치마크")
+    parser.add_argument("page", nargs="?", type=Path, help="응답 페이지 (.json 또는 .json.gz, 기본값: fixtures/bid_page.json.gz)")
+    parser.add_argument("--cached", action="store_true", help="http_cache에 가장 최근에 캐시된 응답 사용")
+    parser.add_argument("--repeat", type=int, default=20, help="백엔드별 반복 횟수")
+    args = parser.parse_args(argv)
+
+    raw = load_page(args.page, args.cached)
+    print(f"응답 크기: {len(raw) / 1024:.0f}KB, 반복: {args.repeat}회")
+    print(f"{'backend':<10}{'project':<9}{'ms/page':>10}{'items':>8}{'B/item':>10}")
+    for backend in BACKENDS:
+        for project in (False, True):
+            result = bench(raw, backend, project, args.repeat)
+            if result is None:
+                print(f"{backend:<10}{str(project):<9}{'(설치되지 않음)':>10}")
+                continue
+            per_page, items, per_item = result
+            print(f"{backend:<10}{str(project):<9}{per_page * 1000:>10.2f}{items:>8}{per_item:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
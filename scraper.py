@@ -1,16 +1,67 @@
 """나라장터 입찰공고정보서비스 - 용역 입찰공고 수집기"""
 
+import argparse
+import asyncio
+import csv
+import gzip
+import hashlib
 import json
 import logging
+import math
 import os
+import random
+import re
+import shutil
+import sqlite3
 import sys
+import tempfile
+import threading
 import time
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
+from typing import Any, Callable, Generator, Iterable
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.utils import get_column_letter
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # only required for the async engine
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON decoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional faster JSON decoder with typed projection
+    msgspec = None
+
+try:
+    import numpy as np
+except ImportError:  # only required for columnar NoticeBatch analytics
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pa_dataset
+except ImportError:  # only required for Parquet / Arrow output
+    pa = None
 
 load_dotenv()
 
@@ -21,10 +72,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-BASE_URL = "http://apis.data.go.kr/1230000/BidPublicInfoService/getBidPblancListInfoServc"
+SERVICE_URL = "http://apis.data.go.kr/1230000/BidPublicInfoService"
+# BidPublicInfoService list operation of each bid category (업무구분).
+BID_CATEGORIES = {
+    "용역": "getBidPblancListInfoServc",
+    "물품": "getBidPblancListInfoThng",
+    "공사": "getBidPblancListInfoCnstwk",
+    "외자": "getBidPblancListInfoFrgcpt",
+}
 KST = timezone(timedelta(hours=9))
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2  # seconds
+NO_DATA_RESULT_CODE = "03"
+# APPLICATION_ERROR, DB_ERROR, HTTP_ERROR, SERVICETIMEOUT_ERROR,
+# LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+TRANSIENT_RESULT_CODES = frozenset({"01", "02", "04", "05", "22"})
+
+PageCallback = Callable[[list[dict]], None]
+# A page's items with the totalCount the API reported for the whole window.
+PageResult = tuple[list[dict], int]
+# HTTP status, raw body and cache validators (ETag / Last-Modified) of one API response.
+ApiResponse = tuple[int, bytes, dict[str, str]]
 
 COLUMNS = [
     ("bidNtceNo", "공고번호"),
@@ -37,7 +105,90 @@ COLUMNS = [
     ("bidNtceDt", "공고일시"),
     ("rbidPermsnYn", "재입찰허용여부"),
     ("bidNtceDtlUrl", "공고URL"),
+    ("category", "업무구분"),
 ]
+API_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_price(value: Any) -> int | None:
+    try:
+        return int(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_api_datetime(value: Any) -> datetime | None:
+    """Parse API timestamps ("2024-05-01 10:31:12", KST wall time) to naive datetimes."""
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
+class BidNotice:
+    """One notice reduced to the COLUMNS fields.
+
+    Prices are parsed to int and timestamps to datetime once, when the notice
+    leaves the fetch layer, so filtering and report writing never touch the
+    raw API dicts (and their ~60 unused string fields) again.
+    """
+
+    bidNtceNo: str
+    bidNtceNm: str
+    ntceInsttNm: str
+    bidNtceOrd: str
+    bidClseDt: datetime | None
+    presmptPrce: int | None
+    asignBdgtAmt: int | None
+    bidNtceDt: datetime | None
+    rbidPermsnYn: str
+    bidNtceDtlUrl: str
+    category: str
+    # Earlier bidNtceOrd revisions folded under this one by resolve_revisions.
+    superseded: int = 0
+    # 신규 / 정정 / 변동없음 relative to the previous run, set by classify_changes.
+    change: str = ""
+
+    @classmethod
+    def from_item(cls, item: dict) -> "BidNotice":
+        return cls(
+            bidNtceNo=item.get("bidNtceNo") or "",
+            bidNtceNm=item.get("bidNtceNm") or "",
+            # Agency names repeat across thousands of notices; share one string each.
+            ntceInsttNm=sys.intern(item.get("ntceInsttNm") or ""),
+            bidNtceOrd=item.get("bidNtceOrd") or "",
+            bidClseDt=_parse_api_datetime(item.get("bidClseDt")),
+            presmptPrce=_parse_price(item.get("presmptPrce")),
+            asignBdgtAmt=_parse_price(item.get("asignBdgtAmt")),
+            bidNtceDt=_parse_api_datetime(item.get("bidNtceDt")),
+            rbidPermsnYn=item.get("rbidPermsnYn") or "",
+            bidNtceDtlUrl=item.get("bidNtceDtlUrl") or "",
+            # Untagged items predate multi-category collection, which only fetched 용역.
+            category=sys.intern(item.get("category") or "용역"),
+        )
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.bidNtceNo, self.bidNtceOrd
+
+    def as_item(self) -> dict:
+        """Return the notice in the API's dict shape (strings only), e.g. for JSON state files."""
+        item = {}
+        for field, _ in COLUMNS:
+            value = getattr(self, field)
+            if value is None:
+                value = ""
+            elif isinstance(value, datetime):
+                value = value.strftime(API_DATETIME_FORMAT)
+            else:
+                value = str(value)
+            item[field] = value
+        return item
+
+
+def to_notices(items: Iterable[dict]) -> list[BidNotice]:
+    return [BidNotice.from_item(item) for item in items]
 
 
 def load_config() -> dict:
@@ -54,52 +205,550 @@ def get_api_key() -> str:
     return key
 
 
-def build_params(config: dict, target_date: datetime) -> dict:
+def build_params(
+    config: dict, target_date: datetime,
+    begin_date: datetime | None = None, end_date: datetime | None = None,
+) -> dict:
+    """Build the query for the ``days_back`` window ending on ``target_date``.
+
+    When ``begin_date`` / ``end_date`` are given, the window starts / ends at
+    that exact minute instead of ``start_hour`` on the first day / ``end_hour``
+    on ``target_date`` (used for incremental collection and backfill shards).
+    """
     start_hour = config.get("search_period", {}).get("start_hour", "0000")
     end_hour = config.get("search_period", {}).get("end_hour", "2359")
     days_back = config.get("days_back", 0)
 
-    begin_date = target_date - timedelta(days=days_back)
-    begin_date_str = begin_date.strftime("%Y%m%d")
-    end_date_str = target_date.strftime("%Y%m%d")
+    if begin_date is None:
+        begin_date = target_date - timedelta(days=days_back)
+        inqry_bgn_dt = f"{begin_date.strftime('%Y%m%d')}{start_hour}"
+    else:
+        inqry_bgn_dt = begin_date.strftime("%Y%m%d%H%M")
+    if end_date is None:
+        inqry_end_dt = f"{target_date.strftime('%Y%m%d')}{end_hour}"
+    else:
+        inqry_end_dt = end_date.strftime("%Y%m%d%H%M")
 
     return {
         "pageNo": 1,
         "numOfRows": config.get("num_of_rows", 999),
         "inqryDiv": config.get("inqry_div", "1"),
-        "inqryBgnDt": f"{begin_date_str}{start_hour}",
-        "inqryEndDt": f"{end_date_str}{end_hour}",
+        "inqryBgnDt": inqry_bgn_dt,
+        "inqryEndDt": inqry_end_dt,
         "type": "json",
     }
 
 
-def _request_with_retry(url: str, params: dict) -> requests.Response | None:
-    """Send GET request with retry and exponential backoff for transient errors."""
-    for attempt in range(MAX_RETRIES):
+class TokenBucket:
+    """Thread-safe token bucket pacing every API call in the process.
+
+    Each call reserves a token up front and is told how long to wait for it,
+    so threads and coroutines can share one bucket.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self.total_wait = 0.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.total_wait += wait
+
+            self._recent.append(now + wait)
+            while self._recent and self._recent[0] < now - 10:
+                self._recent.popleft()
+        if wait > 0:
+            logger.log(
+                logging.INFO if wait >= 1 else logging.DEBUG,
+                "요청 속도 제한: %.2f초 대기 (최근 %.1f회/초)", wait, self.current_rate(),
+            )
+        return wait
+
+    def current_rate(self) -> float:
+        """Requests per second granted over (up to) the last ten seconds."""
+        recent = list(self._recent)
+        if len(recent) < 2 or recent[-1] <= recent[0]:
+            return 0.0
+        return (len(recent) - 1) / (recent[-1] - recent[0])
+
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_rate_limiter: TokenBucket | None = None
+
+
+def configure_rate_limit(config: dict) -> TokenBucket | None:
+    """Install the process-wide limiter described by config.json "rate_limit"."""
+    global _rate_limiter
+    rate_limit = config.get("rate_limit", {})
+    rate = rate_limit.get("per_second", 0)
+    burst = rate_limit.get("burst", max(1, int(rate)))
+    if not rate:
+        _rate_limiter = None
+    elif _rate_limiter is None or (_rate_limiter.rate, _rate_limiter.burst) != (rate, burst):
+        _rate_limiter = TokenBucket(rate, burst)
+        logger.info("요청 속도 제한: 초당 %s회, 최대 %d회 연속", rate, burst)
+    return _rate_limiter
+
+
+_page_checkpoint_dir: Path | None = None
+_page_checkpoint_max_age = timedelta(hours=24)
+
+
+def configure_page_checkpoints(config: dict) -> Path | None:
+    """Enable per-page checkpoints as described by config.json "page_checkpoint"."""
+    global _page_checkpoint_dir, _page_checkpoint_max_age
+    page_checkpoint = config.get("page_checkpoint", {})
+    if page_checkpoint.get("enabled", False):
+        _page_checkpoint_dir = _state_dir(config) / page_checkpoint.get("dir", "pages")
+        _page_checkpoint_max_age = timedelta(hours=page_checkpoint.get("max_age_hours", 24))
+        _prune_page_checkpoints()
+    else:
+        _page_checkpoint_dir = None
+    return _page_checkpoint_dir
+
+
+def _prune_page_checkpoints() -> None:
+    """Delete window directories nothing has written to for ``max_age_hours``.
+
+    Incremental windows start at a different minute every run, so the pages
+    of a failed window are never reused; without pruning they pile up in the
+    state directory kept between runs.
+    """
+    if not _page_checkpoint_dir.is_dir():
+        return
+    cutoff = time.time() - _page_checkpoint_max_age.total_seconds()
+    pruned = 0
+    for window_dir in _page_checkpoint_dir.iterdir():
+        try:
+            # Saving a page renames it into the directory, which bumps its mtime.
+            if not window_dir.is_dir() or window_dir.stat().st_mtime > cutoff:
+                continue
+        except OSError:
+            continue
+        shutil.rmtree(window_dir, ignore_errors=True)
+        pruned += 1
+    if pruned:
+        logger.info("오래된 페이지 체크포인트 정리: %d개 구간 삭제", pruned)
+
+
+_http_cache_dir: Path | None = None
+_http_cache_ttl = timedelta(minutes=10)
+_http_cache_max_bytes = 200 * 1024 * 1024
+_http_cache_size: int | None = None
+_http_cache_lock = threading.Lock()
+
+
+def configure_http_cache(config: dict) -> Path | None:
+    """Enable the on-disk response cache described by config.json "http_cache"."""
+    global _http_cache_dir, _http_cache_ttl, _http_cache_max_bytes, _http_cache_size
+    http_cache = config.get("http_cache", {})
+    if http_cache.get("enabled", False):
+        _http_cache_dir = _state_dir(config) / http_cache.get("dir", "http_cache")
+        _http_cache_ttl = timedelta(minutes=http_cache.get("ttl_minutes", 10))
+        _http_cache_max_bytes = int(http_cache.get("max_mb", 200) * 1024 * 1024)
+    else:
+        _http_cache_dir = None
+    _http_cache_size = None
+    return _http_cache_dir
+
+
+def configure_fetch(config: dict) -> None:
+    """Install every process-wide fetch setting (limiter, retries, checkpoints, cache, decoder).
+
+    Called once per run by main; library callers call it themselves before fetching.
+    """
+    configure_rate_limit(config)
+    configure_retry(config)
+    configure_page_checkpoints(config)
+    configure_http_cache(config)
+    configure_json_decoder(config)
+
+
+def _cache_path(url: str, params: dict) -> Path | None:
+    if _http_cache_dir is None:
+        return None
+    endpoint = url.split("?", 1)[0]
+    query = sorted((k, str(v)) for k, v in params.items() if k != "ServiceKey")
+    key = hashlib.sha1(json.dumps([endpoint, query]).encode("utf-8")).hexdigest()
+    return _http_cache_dir / key[:2] / f"{key}.json.gz"
+
+
+def _cache_ttl(params: dict) -> float | None:
+    """Seconds a response stays fresh; None for windows that have already closed."""
+    inqry_end = datetime.strptime(params["inqryEndDt"], "%Y%m%d%H%M").replace(tzinfo=KST)
+    if inqry_end < datetime.now(KST):
+        return None
+    return _http_cache_ttl.total_seconds()
+
+
+def _cache_get(url: str, params: dict) -> tuple[bytes | None, bool]:
+    """Return the cached response (or None) and whether it is still fresh."""
+    path = _cache_path(url, params)
+    if path is None:
+        return None, False
+    try:
+        stat = path.stat()
+        ttl = _cache_ttl(params)
+        fresh = ttl is None or time.time() - stat.st_mtime <= ttl
+        with gzip.open(path, "rb") as f:
+            raw = f.read()
+        # atime records the last use for LRU eviction; mtime keeps the fetch time.
+        os.utime(path, (time.time(), stat.st_mtime))
+    except OSError:
+        return None, False
+    return raw, fresh
+
+
+def _cache_drop_pages(url: str, params: dict, total_count: int) -> None:
+    """Forget the cached pages after page 1 of a window that reported ``total_count`` notices."""
+    global _http_cache_size
+    if _http_cache_dir is None:
+        return
+    for page in range(2, math.ceil(total_count / params["numOfRows"]) + 1):
+        path = _cache_path(url, dict(params, pageNo=page))
+        path.unlink(missing_ok=True)
+        _validators_path(path).unlink(missing_ok=True)
+    with _http_cache_lock:
+        _http_cache_size = None
+
+
+def _cache_pages_fresh(url: str, params: dict, total_count: int | None) -> bool:
+    """Whether pages 2.. of a window reporting ``total_count`` notices are all cached and fresh."""
+    ttl = _cache_ttl(params)
+    if ttl is None:
+        return True
+    if total_count is None:
+        return False
+    now = time.time()
+    for page in range(2, math.ceil(total_count / params["numOfRows"]) + 1):
+        try:
+            if now - _cache_path(url, dict(params, pageNo=page)).stat().st_mtime > ttl:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _validators_path(path: Path) -> Path:
+    return path.with_name(path.name.replace(".json.gz", ".validators.json"))
+
+
+def _response_validators(headers) -> dict[str, str]:
+    """The ETag / Last-Modified of a response, for revalidating its cached copy later."""
+    return {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+
+
+def _cache_conditional_headers(url: str, params: dict) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for a cached response, if the server sent validators."""
+    path = _cache_path(url, params)
+    if path is None:
+        return {}
+    try:
+        with open(_validators_path(path), "r", encoding="utf-8") as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+
+def _cache_revalidated(url: str, params: dict) -> None:
+    """Mark a cached response fresh again after the server answered 304 Not Modified."""
+    path = _cache_path(url, params)
+    if path is not None:
+        now = time.time()
+        os.utime(path, (now, now))
+
+
+def _cache_put(url: str, params: dict, raw: bytes, validators: dict[str, str] | None = None) -> None:
+    global _http_cache_size
+    path = _cache_path(url, params)
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    with gzip.open(tmp_path, "wb", compresslevel=5) as f:
+        f.write(raw)
+    tmp_path.replace(path)
+    validators_path = _validators_path(path)
+    if validators:
+        with open(validators_path, "w", encoding="utf-8") as f:
+            json.dump(validators, f)
+    else:
+        validators_path.unlink(missing_ok=True)
+
+    with _http_cache_lock:
+        if _http_cache_size is None:
+            _http_cache_size = sum(p.stat().st_size for p in _http_cache_dir.rglob("*.json.gz"))
+        else:
+            _http_cache_size += path.stat().st_size
+        if _http_cache_size > _http_cache_max_bytes:
+            _evict_http_cache()
+
+
+def _evict_http_cache() -> None:
+    """Delete least recently used responses until the cache is under 90% of its cap."""
+    global _http_cache_size
+    entries = []
+    for path in _http_cache_dir.rglob("*.json.gz"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_atime, stat.st_size, path))
+    entries.sort()
+
+    size = sum(entry_size for _, entry_size, _ in entries)
+    target = _http_cache_max_bytes * 0.9
+    evicted = 0
+    for _, entry_size, path in entries:
+        if size <= target:
+            break
+        path.unlink(missing_ok=True)
+        _validators_path(path).unlink(missing_ok=True)
+        size -= entry_size
+        evicted += 1
+    _http_cache_size = size
+    logger.info("응답 캐시 정리: %d개 삭제, %.1fMB 사용 중", evicted, size / 1024 / 1024)
+
+
+def _window_dir(url: str, params: dict) -> Path | None:
+    if _page_checkpoint_dir is None:
+        return None
+    query = {k: v for k, v in params.items() if k != "pageNo"}
+    endpoint = url.split("?", 1)[0]
+    key = hashlib.sha1(json.dumps([endpoint, query], sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return _page_checkpoint_dir / f"{params['inqryBgnDt']}_{params['inqryEndDt']}_{key}"
+
+
+def _load_page_checkpoint(url: str, params: dict, page: int, expire: bool = True) -> PageResult | None:
+    window_dir = _window_dir(url, params)
+    if window_dir is None:
+        return None
+    path = window_dir / f"{page}.json.gz"
+    max_age = _page_checkpoint_max_age.total_seconds()
+    # A window still reaching into the future keeps growing; its pages go
+    # stale as quickly as cached responses for it do.
+    ttl = _cache_ttl(params)
+    if ttl is not None:
+        max_age = min(max_age, ttl)
+    try:
+        if expire and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data["items"], data["totalCount"]
+
+
+def _save_page_checkpoint(url: str, params: dict, page: int, items: list[dict], total_count: int) -> None:
+    window_dir = _window_dir(url, params)
+    if window_dir is None:
+        return
+    window_dir.mkdir(parents=True, exist_ok=True)
+    path = window_dir / f"{page}.json.gz"
+    tmp_path = path.with_name(f"{page}.{threading.get_ident()}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump({"items": items, "totalCount": total_count}, f, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def _clear_page_checkpoints(url: str, params: dict) -> None:
+    """Drop a window's page checkpoints once every page has been collected."""
+    window_dir = _window_dir(url, params)
+    if window_dir is not None:
+        shutil.rmtree(window_dir, ignore_errors=True)
+
+
+def _categories(config: dict) -> list[str]:
+    categories = list(dict.fromkeys(config.get("categories", ["용역"])))
+    unknown = [category for category in categories if category not in BID_CATEGORIES]
+    if unknown or not categories:
+        raise ValueError(f"알 수 없는 업무구분입니다: {unknown} (사용 가능: {', '.join(BID_CATEGORIES)})")
+    return categories
+
+
+def _category_url(api_key: str, category: str) -> str:
+    return f"{SERVICE_URL}/{BID_CATEGORIES[category]}?ServiceKey={api_key}"
+
+
+def _tag_category(items: list[dict], category: str) -> list[dict]:
+    """Record which category endpoint the items came from; the payload itself does not say."""
+    for item in items:
+        item["category"] = category
+    return items
+
+
+def _tagging(on_page: PageCallback | None, category: str) -> PageCallback | None:
+    if on_page is None:
+        return None
+    return lambda page_items: on_page(_tag_category(page_items, category))
+
+
+class BoundedSession(requests.Session):
+    """Session that never has more requests in flight than its connection pool holds.
+
+    Split windows and backfill shards start their own worker threads; the
+    shared slots keep their combined requests within ``max_in_flight``, so
+    urllib3 never opens connections it has to discard afterwards.
+    """
+
+    def __init__(self, max_in_flight: int):
+        super().__init__()
+        self.max_in_flight = max_in_flight
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+
+    def request(self, *args, **kwargs):
+        with self._slots:
+            return super().request(*args, **kwargs)
+
+
+def create_session(config: dict, shards: int = 1) -> requests.Session:
+    """Create a keep-alive session whose connection pool is shared by every API call.
+
+    Every category gets ``concurrency`` requests in flight (times ``shards``
+    for a backfill), however many split windows are being fetched. The
+    process-wide fetch settings are installed separately by configure_fetch.
+    """
+    max_in_flight = max(1, config.get("concurrency", 4)) * len(_categories(config)) * shards
+    pool_size = max(config.get("pool_size", 10), max_in_flight)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = BoundedSession(max_in_flight)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How transient failures are retried.
+
+    Waits follow exponential backoff with full jitter (a uniform draw between 0
+    and ``backoff_base ** attempt``, capped at ``backoff_cap``) so parallel
+    workers do not retry in lockstep, and never undercut a server Retry-After.
+    """
+
+    max_retries: int = MAX_RETRIES
+    backoff_base: float = RETRY_BACKOFF_BASE
+    backoff_cap: float = 60.0
+    retry_result_codes: frozenset[str] = TRANSIENT_RESULT_CODES
+
+    @classmethod
+    def from_config(cls, config: dict) -> "RetryPolicy":
+        retry = config.get("retry", {})
+        return cls(
+            max_retries=max(1, retry.get("max_retries", MAX_RETRIES)),
+            backoff_base=retry.get("backoff_base", RETRY_BACKOFF_BASE),
+            backoff_cap=retry.get("backoff_cap", 60.0),
+            retry_result_codes=frozenset(retry.get("result_codes", TRANSIENT_RESULT_CODES)),
+        )
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.max_retries - 1
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        wait = random.uniform(0, min(self.backoff_cap, self.backoff_base ** (attempt + 1)))
+        if retry_after is not None:
+            wait = max(wait, retry_after)
+        return wait
+
+
+_retry_policy = RetryPolicy()
+
+
+def configure_retry(config: dict) -> RetryPolicy:
+    """Install the process-wide retry policy described by config.json "retry"."""
+    global _retry_policy
+    _retry_policy = RetryPolicy.from_config(config)
+    return _retry_policy
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _is_retryable_status(status: int) -> bool:
+    return status >= 500 or status == 429
+
+
+def _request_with_retry(
+    session: requests.Session, url: str, params: dict, headers: dict[str, str] | None = None,
+) -> ApiResponse | None:
+    """Send GET request, retrying transient HTTP and network errors per the retry policy.
+
+    Returns the status code (200, or 304 for a conditional request whose
+    cached copy is still valid), the raw response body and its validators.
+    """
+    policy = _retry_policy
+    for attempt in range(policy.max_retries):
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
         try:
-            resp = requests.get(url, params=params, timeout=30)
-            if resp.status_code >= 500 and attempt < MAX_RETRIES - 1:
-                wait = RETRY_BACKOFF_BASE ** (attempt + 1)
+            resp = session.get(url, params=params, headers=headers, timeout=30)
+            if _is_retryable_status(resp.status_code) and policy.can_retry(attempt):
+                wait = policy.delay(attempt, _parse_retry_after(resp.headers.get("Retry-After")))
                 logger.warning(
-                    "서버 오류 %d, %d초 후 재시도 (%d/%d)",
-                    resp.status_code, wait, attempt + 1, MAX_RETRIES,
+                    "서버 오류 %d, %.1f초 후 재시도 (%d/%d)",
+                    resp.status_code, wait, attempt + 1, policy.max_retries,
                 )
                 time.sleep(wait)
                 continue
             resp.raise_for_status()
-            return resp
+            return resp.status_code, resp.content, _response_validators(resp.headers)
         except requests.ConnectionError as e:
-            if attempt < MAX_RETRIES - 1:
-                wait = RETRY_BACKOFF_BASE ** (attempt + 1)
-                logger.warning("연결 오류, %d초 후 재시도 (%d/%d): %s", wait, attempt + 1, MAX_RETRIES, e)
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("연결 오류, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
                 time.sleep(wait)
                 continue
             logger.error("API 요청 실패 (최대 재시도 초과): %s", e)
             return None
         except requests.Timeout as e:
-            if attempt < MAX_RETRIES - 1:
-                wait = RETRY_BACKOFF_BASE ** (attempt + 1)
-                logger.warning("타임아웃, %d초 후 재시도 (%d/%d): %s", wait, attempt + 1, MAX_RETRIES, e)
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("타임아웃, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
                 time.sleep(wait)
                 continue
             logger.error("API 요청 타임아웃 (최대 재시도 초과): %s", e)
@@ -107,158 +756,2386 @@ def _request_with_retry(url: str, params: dict) -> requests.Response | None:
         except requests.HTTPError as e:
             logger.error("API 요청 실패: %s", e)
             return None
+        except requests.RequestException as e:
+            # Truncated or undecodable bodies (ChunkedEncodingError, ContentDecodingError, ...).
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("응답 수신 오류, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
+                time.sleep(wait)
+                continue
+            logger.error("API 응답 수신 실패 (최대 재시도 초과): %s", e)
+            return None
     return None
 
 
-def fetch_bids(api_key: str, config: dict, target_date: datetime) -> list[dict]:
-    params = build_params(config, target_date)
-    url = f"{BASE_URL}?ServiceKey={api_key}"
-    all_items = []
-    page = 1
+_json_backend = "json"
+_project_fields = False
+_projected_decoder = None
+
+
+def _available_json_backend(name: str) -> str:
+    if name in ("auto", "msgspec") and msgspec is not None:
+        return "msgspec"
+    if name in ("auto", "orjson") and orjson is not None:
+        return "orjson"
+    if name not in ("auto", "json"):
+        logger.warning("JSON 디코더 '%s'를 사용할 수 없어 표준 json을 사용합니다.", name)
+    return "json"
 
+
+def _build_projected_decoder():
+    """msgspec decoder for the response envelope that only materializes COLUMNS fields."""
+    item = msgspec.defstruct(
+        "ProjectedItem", [(field, Any, None) for field, _ in COLUMNS], omit_defaults=True,
+    )
+    header = msgspec.defstruct("Header", [("resultCode", str | None, None), ("resultMsg", str, "")])
+    body = msgspec.defstruct("Body", [("items", list[item] | str, []), ("totalCount", int, 0)])
+    response = msgspec.defstruct("Response", [("header", header), ("body", body | None, None)])
+    envelope = msgspec.defstruct("Envelope", [("response", response)])
+    return msgspec.json.Decoder(envelope)
+
+
+def configure_json_decoder(config: dict) -> str:
+    """Select the JSON backend ("json_backend") and field projection ("project_fields")."""
+    global _json_backend, _project_fields, _projected_decoder
+    _json_backend = _available_json_backend(config.get("json_backend", "auto"))
+    _project_fields = config.get("project_fields", False)
+    _projected_decoder = None
+    if _project_fields and _json_backend == "msgspec":
+        _projected_decoder = _build_projected_decoder()
+    return _json_backend
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _json_backend == "orjson":
+        return orjson.loads(raw)
+    if _json_backend == "msgspec":
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(raw)
+
+
+def _project(item: dict) -> dict:
+    return {field: item[field] for field, _ in COLUMNS if field in item}
+
+
+def _parse_page(raw: bytes) -> tuple[str | None, str, dict]:
+    """Return (resultCode, message, body) of one API response.
+
+    resultCode is None when the payload could not be read at all. With
+    ``project_fields`` the items only keep the COLUMNS fields; on msgspec the
+    other fields are skipped during decoding instead of being built and dropped.
+    """
+    if _projected_decoder is not None:
+        try:
+            envelope = _projected_decoder.decode(raw)
+        except (msgspec.ValidationError, msgspec.DecodeError):
+            pass  # error envelopes and unexpected shapes take the generic path
+        else:
+            header, body = envelope.response.header, envelope.response.body
+            if body is None:
+                return header.resultCode, header.resultMsg, {}
+            items = msgspec.to_builtins(body.items) if body.items else []
+            return header.resultCode, header.resultMsg, {"items": items, "totalCount": body.totalCount}
+
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        # The data.go.kr gateway reports quota/key errors as XML even for type=json.
+        code = re.search(rb"<returnReasonCode>(\w+)</returnReasonCode>", raw)
+        if code is None:
+            return None, raw[:500].decode("utf-8", "replace"), {}
+        message = re.search(rb"<returnAuthMsg>(.*?)</returnAuthMsg>", raw)
+        return code.group(1).decode(), message.group(1).decode() if message else "알 수 없는 오류", {}
+
+    response = data.get("response", {})
+    header = response.get("header", {})
+    body = response.get("body", {})
+    if _project_fields and body.get("items"):
+        body = dict(body, items=[_project(item) for item in body["items"]])
+    return header.get("resultCode"), header.get("resultMsg", "알 수 없는 오류"), body
+
+
+def _page_total(raw: bytes) -> int | None:
+    code, _, body = _parse_page(raw)
+    return body.get("totalCount", 0) if code == "00" else None
+
+
+def _page_steps(url: str, params: dict, page: int) -> Generator[tuple[str, Any], Any, PageResult | None]:
+    """Engine-independent handling of one result page.
+
+    Yields ("request", (page params, headers)) when the page has to come from
+    the API and expects the ApiResponse (None on failure) to be sent back, and
+    ("sleep", seconds) before retrying a transient result code. Returns the
+    page's items with the reported totalCount, or None. Page checkpoints,
+    the HTTP cache and result codes are only handled here, so the sync and
+    async engines (which just perform the I/O) cannot drift apart.
+
+    Page 1 is never restored from its checkpoint: its totalCount decides how
+    many pages there are. A fresh cache entry is still served, since
+    ``ttl_minutes`` bounds how stale an open window's page can be, unless
+    some later page of the window would have to come from the API; then page
+    1 is fetched too, so the pages form one snapshot. When the count differs
+    from the saved one, notices have shifted between pages, so the window's
+    checkpoints and cached pages are dropped.
+    """
+    checkpoint = _load_page_checkpoint(url, params, page, expire=page > 1)
+    if checkpoint is not None and page > 1:
+        logger.info("체크포인트에서 페이지 %d 복원 (%s)", page, params["inqryBgnDt"])
+        return checkpoint
+
+    page_params = dict(params, pageNo=page)
+    policy = _retry_policy
+    saved_total = checkpoint[1] if checkpoint is not None else None
+
+    for attempt in range(policy.max_retries):
+        raw, fresh = _cache_get(url, page_params)
+        if page == 1 and raw is not None:
+            cached_total = _page_total(raw)
+            if saved_total is None:
+                saved_total = cached_total
+            fresh = fresh and _cache_pages_fresh(url, params, cached_total)
+        validators = None
+        if fresh:
+            logger.info("캐시 사용 (%s, 페이지 %d)", params["inqryBgnDt"], page)
+        else:
+            logger.info("API 호출 중... (%s, 페이지 %d)", params["inqryBgnDt"], page)
+            # A stale cached copy is revalidated rather than downloaded again when
+            # the server gave it an ETag or Last-Modified.
+            conditional = _cache_conditional_headers(url, page_params) if raw is not None else {}
+            response = yield "request", (page_params, conditional)
+            if response is None:
+                return None
+            status, body, validators = response
+            if status == 304 and conditional:
+                logger.info("캐시 재검증: 변경 없음 (%s, 페이지 %d)", params["inqryBgnDt"], page)
+                _cache_revalidated(url, page_params)
+                validators = None
+            else:
+                raw = body
+
+        code, message, body = _parse_page(raw)
+        if code == "00":
+            items, total_count = body.get("items", []), body.get("totalCount", 0)
+            if saved_total is not None and saved_total != total_count:
+                logger.info(
+                    "조회 건수가 %d건에서 %d건으로 바뀌어 저장된 페이지를 다시 조회합니다 (%s~%s)",
+                    saved_total, total_count, params["inqryBgnDt"], params["inqryEndDt"],
+                )
+                _clear_page_checkpoints(url, params)
+                _cache_drop_pages(url, params, saved_total)
+            if validators is not None:
+                _cache_put(url, page_params, raw, validators)
+            _save_page_checkpoint(url, params, page, items, total_count)
+            return items, total_count
+        if code == NO_DATA_RESULT_CODE:
+            return [], 0
+        if code in policy.retry_result_codes and policy.can_retry(attempt):
+            wait = policy.delay(attempt)
+            logger.warning(
+                "API 일시 오류 %s(%s), 페이지 %d를 %.1f초 후 다시 조회 (%d/%d)",
+                code, message, page, wait, attempt + 1, policy.max_retries,
+            )
+            yield "sleep", wait
+            continue
+
+        if code is None:
+            logger.error("JSON 파싱 실패. 응답: %s", message)
+        else:
+            logger.error("API 오류: %s", message)
+        return None
+    return None
+
+
+def _fetch_page(session: requests.Session, url: str, params: dict, page: int) -> PageResult | None:
+    """Fetch a single result page and return its items with the reported totalCount.
+
+    Transient API result codes (service busy, traffic exceeded, ...) retry the
+    same page instead of ending the collection.
+    """
+    steps = _page_steps(url, params, page)
+    reply = None
     while True:
-        params["pageNo"] = page
-        logger.info("API 호출 중... (페이지 %d)", page)
+        try:
+            action, arg = steps.send(reply)
+        except StopIteration as stop:
+            return stop.value
+        if action == "sleep":
+            time.sleep(arg)
+            reply = None
+        else:
+            reply = _request_with_retry(session, url, *arg)
 
-        resp = _request_with_retry(url, params)
-        if resp is None:
-            break
 
+def _split_window(params: dict, total_count: int, split: dict | None) -> list[dict] | None:
+    """Bisect an oversized query window, or return None if it should be fetched as is.
+
+    ``split`` is the config.json "window_split" section: windows reporting more
+    than ``max_total_count`` notices are halved until they fit or become
+    shorter than twice ``min_window_minutes``.
+    """
+    max_total_count = (split or {}).get("max_total_count", 0)
+    if not max_total_count or total_count <= max_total_count:
+        return None
+
+    begin = datetime.strptime(params["inqryBgnDt"], "%Y%m%d%H%M")
+    end = datetime.strptime(params["inqryEndDt"], "%Y%m%d%H%M")
+    if end - begin < timedelta(minutes=2 * split.get("min_window_minutes", 60)):
+        return None
+
+    mid = begin + (end - begin) // 2
+    mid = mid.replace(second=0, microsecond=0)
+    logger.info(
+        "조회 건수 %d건이 %d건을 넘어 구간을 나눕니다: %s~%s",
+        total_count, max_total_count, params["inqryBgnDt"], params["inqryEndDt"],
+    )
+    return [
+        dict(params, inqryEndDt=mid.strftime("%Y%m%d%H%M")),
+        dict(params, inqryBgnDt=(mid + timedelta(minutes=1)).strftime("%Y%m%d%H%M")),
+    ]
+
+
+def _merge_halves(
+    url: str, params: dict, results: list[tuple[list[dict], bool]], on_page: PageCallback | None,
+) -> tuple[list[dict], bool]:
+    """Combine the results of a bisected window, dropping notices both halves returned."""
+    all_items = []
+    seen = set()
+    for items, _ in results:
+        fresh = _unique_items(items, seen)
+        all_items.extend(fresh)
+        if on_page is not None and fresh:
+            on_page(fresh)
+    complete = all(ok for _, ok in results)
+    if complete:
+        _clear_page_checkpoints(url, params)
+    return all_items, complete
+
+
+def _finish_window(url: str, params: dict, failed: list[int]) -> bool:
+    """Report the pages of a window that could not be fetched, or drop its checkpoints if none."""
+    if failed:
+        logger.error("페이지 %s 조회 실패 (%s~%s)", failed, params["inqryBgnDt"], params["inqryEndDt"])
+    else:
+        _clear_page_checkpoints(url, params)
+    return not failed
+
+
+def _unique_items(items: list[dict], seen: set[tuple[str, str]]) -> list[dict]:
+    """Drop notices whose (bidNtceNo, bidNtceOrd) is already in ``seen``, recording the rest."""
+    fresh = []
+    for item in items:
+        key = _notice_key(item)
+        if key not in seen:
+            seen.add(key)
+            fresh.append(item)
+    return fresh
+
+
+def iter_window_pages(
+    session: requests.Session, url: str, params: dict, concurrency: int,
+    split: dict | None = None, first: PageResult | None = None,
+) -> Generator[list[dict], None, bool]:
+    """Yield each page's items in page order as soon as that page is available.
+
+    At most ``2 * concurrency`` pages are in flight or buffered at a time, so a
+    slow consumer keeps memory bounded. Oversized windows (see _split_window)
+    are streamed half by half. The generator returns False if a page could not
+    be fetched. ``first`` may carry an already fetched page 1.
+    """
+    if first is None:
+        first = _fetch_page(session, url, params, 1)
+    if first is None:
+        return False
+
+    items, total_count = first
+    halves = _split_window(params, total_count, split)
+    if halves is not None:
+        seen = set()
+        complete = True
+        for half in halves:
+            pages = iter_window_pages(session, url, half, concurrency, split)
+            while True:
+                try:
+                    page_items = next(pages)
+                except StopIteration as stop:
+                    complete = stop.value and complete
+                    break
+                fresh = _unique_items(page_items, seen)
+                if fresh:
+                    yield fresh
+        if complete:
+            _clear_page_checkpoints(url, params)
+        return complete
+
+    if not items:
+        logger.info("조회 결과가 없습니다.")
+        _clear_page_checkpoints(url, params)
+        return True
+
+    fetched = len(items)
+    logger.info("페이지 %d 조회 완료 (%d/%d건)", 1, fetched, total_count)
+    yield items
+
+    # The first page tells us how many pages remain; fetch them concurrently
+    # and hand them out in page order.
+    last_page = math.ceil(total_count / len(items))
+    pages = iter(range(2, last_page + 1))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = deque(
+            (page, pool.submit(_fetch_page, session, url, params, page))
+            for page in islice(pages, 2 * concurrency)
+        )
+        failed = []
+        while pending:
+            page, future = pending.popleft()
+            result = future.result()
+            if result is not None and not result[0]:
+                for _, queued in pending:
+                    queued.cancel()
+                break
+
+            next_page = next(pages, None)
+            if next_page is not None:
+                pending.append((next_page, pool.submit(_fetch_page, session, url, params, next_page)))
+
+            # A page that still fails after its retries is reported, but the
+            # rest of the window is still collected.
+            if result is None:
+                failed.append(page)
+                continue
+
+            fetched += len(result[0])
+            logger.info("페이지 %d 조회 완료 (%d/%d건)", page, fetched, total_count)
+            yield result[0]
+
+    return _finish_window(url, params, failed)
+
+
+def _drain_pages(pages: Generator[list[dict], None, bool], on_page: PageCallback) -> bool:
+    """Feed every page to ``on_page`` and return the generator's completeness flag."""
+    while True:
         try:
-            data = resp.json()
-        except ValueError:
-            logger.error("JSON 파싱 실패. 응답: %s", resp.text[:500])
-            break
+            page_items = next(pages)
+        except StopIteration as stop:
+            return stop.value
+        on_page(page_items)
 
-        response = data.get("response", {})
-        header = response.get("header", {})
 
-        if header.get("resultCode") != "00":
-            logger.error("API 오류: %s", header.get("resultMsg", "알 수 없는 오류"))
-            break
+def _fetch_window(
+    session: requests.Session, url: str, params: dict, concurrency: int,
+    on_page: PageCallback | None = None, split: dict | None = None,
+) -> tuple[list[dict], bool]:
+    """Fetch every page of one query; the flag is False if a page could not be fetched.
 
-        body = response.get("body", {})
-        items = body.get("items", [])
+    ``on_page`` is called from the calling thread with each page's items, in
+    page order, as soon as that page is available. Oversized windows are
+    bisected and both halves fetched in parallel; ``on_page`` then receives
+    each half's deduplicated items.
+    """
+    first = _fetch_page(session, url, params, 1)
+    if first is None:
+        return [], False
 
-        if not items:
-            if page == 1:
-                logger.info("조회 결과가 없습니다.")
-            break
+    halves = _split_window(params, first[1], split)
+    if halves is not None:
+        with ThreadPoolExecutor(max_workers=len(halves)) as pool:
+            futures = [
+                pool.submit(_fetch_window, session, url, half, concurrency, split=split)
+                for half in halves
+            ]
+            results = [future.result() for future in futures]
+        return _merge_halves(url, params, results, on_page)
 
-        all_items.extend(items)
-        total_count = body.get("totalCount", 0)
-        logger.info("페이지 %d 조회 완료 (%d/%d건)", page, len(all_items), total_count)
+    all_items = []
 
-        if len(all_items) >= total_count:
-            break
+    def collect(page_items: list[dict]) -> None:
+        all_items.extend(page_items)
+        if on_page is not None:
+            on_page(page_items)
 
-        page += 1
+    pages = iter_window_pages(session, url, params, concurrency, first=first)
+    complete = _drain_pages(pages, collect)
+    return all_items, complete
 
-    logger.info("총 %d건 조회 완료", len(all_items))
-    return all_items
 
+def _fetch_categories(
+    session: requests.Session, api_key: str, categories: list[str], params: dict, concurrency: int,
+    on_page: PageCallback | None = None, split: dict | None = None,
+) -> tuple[list[dict], bool]:
+    """Fetch one inquiry window from every category endpoint over the shared session.
 
-def filter_by_keywords(items: list[dict], keywords: list[str]) -> dict[str, list[dict]]:
-    results = {}
-    for keyword in keywords:
-        matched = [
-            item for item in items
-            if keyword in (item.get("bidNtceNm") or "")
-        ]
-        results[keyword] = matched
-        logger.info("검색어 '%s': %d건 매칭", keyword, len(matched))
-    return results
+    Items come back tagged with their category, in the configured category
+    order. A single category streams pages to ``on_page`` like _fetch_window;
+    several are fetched in parallel and ``on_page`` receives each category's
+    items on the calling thread once that category is done.
+    """
+    if len(categories) == 1:
+        category = categories[0]
+        url = _category_url(api_key, category)
+        items, complete = _fetch_window(session, url, params, concurrency, _tagging(on_page, category), split)
+        return _tag_category(items, category), complete
 
+    with ThreadPoolExecutor(max_workers=len(categories)) as pool:
+        futures = [
+            pool.submit(_fetch_window, session, _category_url(api_key, category), params, concurrency, split=split)
+            for category in categories
+        ]
+        all_items = []
+        complete = True
+        for category, future in zip(categories, futures):
+            items, ok = future.result()
+            logger.info("%s: %d건", category, len(items))
+            _tag_category(items, category)
+            if on_page is not None and items:
+                on_page(items)
+            all_items.extend(items)
+            complete = complete and ok
+    return all_items, complete
 
-def write_excel(filtered: dict[str, list[dict]], target_date: datetime, output_dir: Path) -> Path:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    date_str = target_date.strftime("%Y%m%d")
-    filepath = output_dir / f"g2b_용역공고_{date_str}.xlsx"
 
-    wb = Workbook()
-    # Remove default sheet
-    wb.remove(wb.active)
+def iter_bids(
+    api_key: str, config: dict, target_date: datetime,
+    session: requests.Session | None = None, begin_date: datetime | None = None,
+) -> Generator[list[dict], None, bool]:
+    """Streaming counterpart of fetch_bids: yields pages (tagged with their category) instead of one list."""
+    if session is None:
+        with create_session(config) as session:
+            return (yield from iter_bids(api_key, config, target_date, session, begin_date))
 
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
-    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    params = build_params(config, target_date, begin_date)
+    concurrency = max(1, config.get("concurrency", 4))
+    split = config.get("window_split")
+    complete = True
+    # Categories are streamed one after another to keep memory flat.
+    for category in _categories(config):
+        pages = iter_window_pages(session, _category_url(api_key, category), params, concurrency, split)
+        while True:
+            try:
+                page_items = next(pages)
+            except StopIteration as stop:
+                complete = complete and stop.value
+                break
+            yield _tag_category(page_items, category)
+    return complete
 
-    for keyword, items in filtered.items():
-        ws = wb.create_sheet(title=keyword)
 
-        # Write header
-        for col_idx, (_, col_name) in enumerate(COLUMNS, 1):
-            cell = ws.cell(row=1, column=col_idx, value=col_name)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
+def fetch_bids(
+    api_key: str, config: dict, target_date: datetime,
+    session: requests.Session | None = None, begin_date: datetime | None = None,
+    columnar: bool = False,
+) -> "list[dict] | NoticeBatch":
+    """Fetch the whole window as raw API dicts, or as a NoticeBatch with ``columnar``.
 
-        # Write data
-        for row_idx, item in enumerate(items, 2):
-            for col_idx, (field, _) in enumerate(COLUMNS, 1):
-                value = item.get(field, "")
-                if field == "presmptPrce" or field == "asignBdgtAmt":
-                    try:
-                        value = int(value) if value else ""
-                    except (ValueError, TypeError):
-                        pass
-                ws.cell(row=row_idx, column=col_idx, value=value)
+    The columnar form converts every page as it arrives, so the raw dicts of
+    only one page are alive at a time.
+    """
+    pages = iter_bids(api_key, config, target_date, session, begin_date)
+    if columnar:
+        notices = []
+        _drain_pages(pages, lambda page_items: notices.extend(to_notices(page_items)))
+        logger.info("총 %d건 조회 완료", len(notices))
+        return NoticeBatch.from_notices(notices)
 
-        # Auto-fit column widths (approximate)
-        for col_idx, (_, col_name) in enumerate(COLUMNS, 1):
-            max_len = len(col_name)
-            for row in ws.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
-                for cell in row:
-                    if cell.value:
-                        max_len = max(max_len, min(len(str(cell.value)), 60))
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = max_len + 4
+    all_items = []
+    _drain_pages(pages, all_items.extend)
+    logger.info("총 %d건 조회 완료", len(all_items))
+    return all_items
 
-        # Freeze header row
-        ws.freeze_panes = "A2"
 
-    # Add summary sheet
-    ws_summary = wb.create_sheet(title="요약", index=0)
-    ws_summary.cell(row=1, column=1, value="검색어").font = Font(bold=True)
-    ws_summary.cell(row=1, column=2, value="건수").font = Font(bold=True)
-    ws_summary.cell(row=1, column=3, value="조회일자").font = Font(bold=True)
-    for idx, (keyword, items) in enumerate(filtered.items(), 2):
-        ws_summary.cell(row=idx, column=1, value=keyword)
-        ws_summary.cell(row=idx, column=2, value=len(items))
-        ws_summary.cell(row=idx, column=3, value=date_str)
-    ws_summary.column_dimensions["A"].width = 20
-    ws_summary.column_dimensions["B"].width = 10
-    ws_summary.column_dimensions["C"].width = 15
+async def _request_with_retry_async(
+    session, url: str, params: dict, headers: dict[str, str] | None = None,
+) -> ApiResponse | None:
+    """Async counterpart of _request_with_retry; returns (status, raw body, validators)."""
+    # The ServiceKey is already embedded (and possibly pre-encoded) in ``url``,
+    # so build the final URL ourselves and stop aiohttp from re-quoting it.
+    query = "&".join(f"{k}={v}" for k, v in params.items())
+    target = URL(f"{url}&{query}", encoded=True)
+    policy = _retry_policy
+    for attempt in range(policy.max_retries):
+        if _rate_limiter is not None:
+            await _rate_limiter.acquire_async()
+        try:
+            async with session.get(target, headers=headers) as resp:
+                if _is_retryable_status(resp.status) and policy.can_retry(attempt):
+                    wait = policy.delay(attempt, _parse_retry_after(resp.headers.get("Retry-After")))
+                    logger.warning(
+                        "서버 오류 %d, %.1f초 후 재시도 (%d/%d)",
+                        resp.status, wait, attempt + 1, policy.max_retries,
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                resp.raise_for_status()
+                return resp.status, await resp.read(), _response_validators(resp.headers)
+        except aiohttp.ClientResponseError as e:
+            logger.error("API 요청 실패: %s", e)
+            return None
+        except aiohttp.ClientConnectionError as e:
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("연결 오류, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
+                await asyncio.sleep(wait)
+                continue
+            logger.error("API 요청 실패 (최대 재시도 초과): %s", e)
+            return None
+        except asyncio.TimeoutError as e:
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("타임아웃, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
+                await asyncio.sleep(wait)
+                continue
+            logger.error("API 요청 타임아웃 (최대 재시도 초과): %s", e)
+            return None
+        except aiohttp.ClientError as e:
+            # Truncated or undecodable bodies (ClientPayloadError, ...).
+            if policy.can_retry(attempt):
+                wait = policy.delay(attempt)
+                logger.warning("응답 수신 오류, %.1f초 후 재시도 (%d/%d): %s", wait, attempt + 1, policy.max_retries, e)
+                await asyncio.sleep(wait)
+                continue
+            logger.error("API 응답 수신 실패 (최대 재시도 초과): %s", e)
+            return None
+    return None
 
-    wb.save(filepath)
-    logger.info("엑셀 저장 완료: %s", filepath)
-    return filepath
 
+async def _fetch_page_async(
+    session, semaphore: asyncio.Semaphore, url: str, params: dict, page: int,
+) -> PageResult | None:
+    """Async counterpart of _fetch_page; only the API request itself holds the semaphore."""
+    steps = _page_steps(url, params, page)
+    reply = None
+    while True:
+        try:
+            action, arg = steps.send(reply)
+        except StopIteration as stop:
+            return stop.value
+        if action == "sleep":
+            await asyncio.sleep(arg)
+            reply = None
+        else:
+            async with semaphore:
+                reply = await _request_with_retry_async(session, url, *arg)
 
-def main():
-    config = load_config()
-    api_key = get_api_key()
-    keywords = config.get("keywords", ["조사", "연구"])
 
-    # Use today in KST
-    target_date = datetime.now(KST)
-    logger.info("조회 대상일: %s", target_date.strftime("%Y-%m-%d"))
-    logger.info("검색어: %s", keywords)
+async def _fetch_query_async(
+    session, semaphore: asyncio.Semaphore, url: str, params: dict,
+    on_page: PageCallback | None = None, split: dict | None = None,
+) -> tuple[list[dict], bool]:
+    first = await _fetch_page_async(session, semaphore, url, params, 1)
+    if first is None:
+        return [], False
 
-    items = fetch_bids(api_key, config, target_date)
+    items, total_count = first
+    halves = _split_window(params, total_count, split)
+    if halves is not None:
+        results = await asyncio.gather(*(
+            _fetch_query_async(session, semaphore, url, half, split=split) for half in halves
+        ))
+        return _merge_halves(url, params, results, on_page)
 
     if not items:
-        logger.info("조회된 공고가 없어 엑셀을 생성하지 않습니다.")
-        return
+        logger.info("조회 결과가 없습니다. (%s~%s)", params["inqryBgnDt"], params["inqryEndDt"])
+        _clear_page_checkpoints(url, params)
+        return [], True
 
-    filtered = filter_by_keywords(items, keywords)
-    total_matched = sum(len(v) for v in filtered.values())
+    last_page = math.ceil(total_count / len(items))
+    results = await asyncio.gather(*(
+        _fetch_page_async(session, semaphore, url, params, page)
+        for page in range(2, last_page + 1)
+    ))
 
-    if total_matched == 0:
-        logger.info("검색어에 매칭되는 공고가 없습니다.")
+    all_items = list(items)
+    failed = []
+    if on_page is not None:
+        on_page(items)
+    for page, result in enumerate(results, 2):
+        if result is None:
+            failed.append(page)
+            continue
+        if not result[0]:
+            break
+        all_items.extend(result[0])
+        if on_page is not None:
+            on_page(result[0])
+    complete = _finish_window(url, params, failed)
+    logger.info(
+        "%s~%s (inqryDiv=%s) %d/%d건 조회 완료",
+        params["inqryBgnDt"], params["inqryEndDt"], params["inqryDiv"], len(all_items), total_count,
+    )
+    return all_items, complete
 
-    output_dir = Path(__file__).parent / "output"
-    filepath = write_excel(filtered, target_date, output_dir)
-    logger.info("완료. 파일: %s", filepath)
+
+async def fetch_queries_async(
+    api_key: str, config: dict, queries: list[tuple[str, dict]], on_page: PageCallback | None = None,
+) -> list[tuple[list[dict], bool]]:
+    """Fetch several (category, inquiry params) queries on one event loop.
+
+    All queries share a single connection pool and a semaphore that bounds the
+    number of pages in flight to ``config["concurrency"]``. Items are tagged
+    with their category, and each result carries a flag telling whether every
+    page of that query was fetched.
+    """
+    if aiohttp is None:
+        raise RuntimeError("async 엔진을 사용하려면 aiohttp를 설치하세요: pip install aiohttp")
+
+    concurrency = max(1, config.get("concurrency", 4))
+    split = config.get("window_split")
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=config.get("pool_size", max(10, concurrency)))
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(*(
+            _fetch_query_async(
+                session, semaphore, _category_url(api_key, category), params,
+                _tagging(on_page, category), split,
+            )
+            for category, params in queries
+        ))
+    for (category, _), (items, _) in zip(queries, results):
+        _tag_category(items, category)
+    return results
+
+
+def _async_queries(
+    config: dict, target_date: datetime, begin_date: datetime | None,
+) -> list[tuple[str, dict]]:
+    inqry_divs = config.get("inqry_div", "1")
+    if not isinstance(inqry_divs, list):
+        inqry_divs = [inqry_divs]
+    return [
+        (category, build_params(dict(config, inqry_div=inqry_div), target_date, begin_date))
+        for category in _categories(config)
+        for inqry_div in inqry_divs
+    ]
+
+
+def _merge_query_results(results: list[tuple[list[dict], bool]]) -> list[dict]:
+    """Concatenate per-query items, keeping the first copy of each (bidNtceNo, bidNtceOrd).
+
+    Different inquiry types largely return the same notices, so a notice
+    found by several queries must only be reported once.
+    """
+    seen = set()
+    return [item for items, _ in results for item in _unique_items(items, seen)]
+
+
+def fetch_bids_async(
+    api_key: str, config: dict, target_date: datetime, begin_date: datetime | None = None,
+) -> list[dict]:
+    """Drop-in replacement for fetch_bids running on the asyncio engine.
+
+    ``config["inqry_div"]`` may be a list, in which case every value is queried
+    concurrently (for every category) and the results are merged in the
+    configured order, each notice once.
+    """
+    queries = _async_queries(config, target_date, begin_date)
+    results = asyncio.run(fetch_queries_async(api_key, config, queries))
+    all_items = _merge_query_results(results)
+    logger.info("총 %d건 조회 완료", len(all_items))
+    return all_items
+
+
+def collect_bids(
+    api_key: str, config: dict, target_date: datetime, engine: str,
+    begin_date: datetime | None = None, on_page: PageCallback | None = None,
+) -> tuple[list[BidNotice], bool]:
+    """Fetch every configured category with the selected engine and report whether the whole window was collected.
+
+    ``on_page`` still sees the raw API dicts of each page (e.g. for the store);
+    the returned notices are already converted to BidNotice records.
+    """
+    if engine == "async":
+        queries = _async_queries(config, target_date, begin_date)
+        results = asyncio.run(fetch_queries_async(api_key, config, queries, on_page))
+        all_items = _merge_query_results(results)
+        complete = all(ok for _, ok in results)
+    else:
+        params = build_params(config, target_date, begin_date)
+        concurrency = max(1, config.get("concurrency", 4))
+        with create_session(config) as session:
+            all_items, complete = _fetch_categories(
+                session, api_key, _categories(config), params, concurrency, on_page, config.get("window_split"),
+            )
+    notices = to_notices(all_items)
+    del all_items
+
+    logger.info("총 %d건 조회 완료", len(notices))
+    if _rate_limiter is not None:
+        logger.info(
+            "요청 속도: 최근 %.1f회/초, 속도 제한 누적 대기 %.1f초",
+            _rate_limiter.current_rate(), _rate_limiter.total_wait,
+        )
+    if not complete:
+        logger.warning("일부 페이지를 가져오지 못했습니다. 조회 결과가 불완전합니다.")
+    return notices, complete
+
+
+def _notice_key(item: dict) -> tuple[str, str]:
+    return item.get("bidNtceNo") or "", item.get("bidNtceOrd") or ""
+
+
+def _state_dir(config: dict) -> Path:
+    return Path(__file__).parent / config.get("state_dir", "state")
+
+
+def _query_signature(config: dict) -> dict:
+    search_period = config.get("search_period", {})
+    return {
+        "categories": _categories(config),
+        "inqry_div": config.get("inqry_div", "1"),
+        "days_back": config.get("days_back", 0),
+        "start_hour": search_period.get("start_hour", "0000"),
+        "end_hour": search_period.get("end_hour", "2359"),
+    }
+
+
+def _history_source(config: dict) -> str:
+    """Where incremental runs keep the notices they merge with: the store DB or history.json.gz."""
+    store = config.get("store", {})
+    return store.get("path", "notices.db") if store.get("enabled", False) else "history.json.gz"
+
+
+def load_checkpoint(state_dir: Path) -> dict | None:
+    path = state_dir / "checkpoint.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(state_dir: Path, checkpoint: dict) -> None:
+    state_dir.mkdir(parents=True, exist_ok=True)
+    path = state_dir / "checkpoint.json"
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    tmp_path.replace(path)
+
+
+def load_history(state_dir: Path) -> list[BidNotice]:
+    path = state_dir / "history.json.gz"
+    if not path.exists():
+        return []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return to_notices(json.load(f))
+
+
+def save_history(state_dir: Path, notices: list[BidNotice]) -> None:
+    state_dir.mkdir(parents=True, exist_ok=True)
+    path = state_dir / "history.json.gz"
+    tmp_path = path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump([notice.as_item() for notice in notices], f, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def incremental_begin(config: dict, target_date: datetime, checkpoint: dict | None) -> datetime | None:
+    """Return where the delta query should start, or None when a full window is needed."""
+    if checkpoint is None:
+        logger.info("체크포인트가 없어 전체 기간을 조회합니다.")
+        return None
+    if checkpoint.get("query") != _query_signature(config):
+        logger.info("조회 조건이 변경되어 전체 기간을 조회합니다.")
+        return None
+    if checkpoint.get("history") != _history_source(config):
+        # The other source was not kept up to date while this checkpoint advanced.
+        logger.info("이전 수집분 저장 위치가 변경되어 전체 기간을 조회합니다.")
+        return None
+
+    window_begin = build_params(config, target_date)["inqryBgnDt"]
+    high_water = checkpoint.get("inqry_end_dt", "")
+    if high_water < window_begin:
+        logger.info("마지막 수집 시점(%s)이 조회 기간 이전이라 전체 기간을 조회합니다.", high_water)
+        return None
+
+    overlap = timedelta(minutes=config.get("incremental_overlap_minutes", 60))
+    begin = datetime.strptime(high_water, "%Y%m%d%H%M").replace(tzinfo=KST) - overlap
+    begin = max(begin, datetime.strptime(window_begin, "%Y%m%d%H%M").replace(tzinfo=KST))
+    logger.info("증분 조회: %s 이후 공고만 조회합니다.", begin.strftime("%Y-%m-%d %H:%M"))
+    return begin
+
+
+def merge_items(history: list[BidNotice], new_items: list[BidNotice], window_begin: str) -> list[BidNotice]:
+    """Merge freshly fetched notices into the stored history.
+
+    Fresh copies replace stored ones with the same (bidNtceNo, bidNtceOrd), and
+    notices posted before ``window_begin`` (YYYYMMDDHHMM, empty for no limit)
+    are dropped so the result covers the same ``days_back`` window as a full fetch.
+    """
+    merged = {notice.key: notice for notice in history}
+    for notice in new_items:
+        merged[notice.key] = notice
+    begin = datetime.strptime(window_begin, "%Y%m%d%H%M") if window_begin else None
+    return [
+        notice for notice in merged.values()
+        if begin is None or notice.bidNtceDt is None or notice.bidNtceDt >= begin
+    ]
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton that finds every configured keyword in one pass over a title."""
+
+    def __init__(self, keywords: list[str]):
+        self.keywords = list(keywords)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+
+        outputs: list[set[int]] = [set()]
+        for idx, keyword in enumerate(self.keywords):
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                node = nxt
+            outputs[node].add(idx)
+
+        # Breadth-first pass to wire failure links and inherit their outputs.
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child] |= outputs[self._fail[child]]
+                queue.append(child)
+        self._out = [frozenset(out | outputs[0]) for out in outputs]
+
+    def find(self, text: str) -> set[int]:
+        """Return the indices of all keywords occurring in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        matched = set(out[0])
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                matched |= out[node]
+        return matched
+
+
+@lru_cache(maxsize=8)
+def build_keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords))
+
+
+# Query language for keyword sheets. Bare words (and runs of them, spaces
+# included) and "phrases" are title substrings; /regex/ is searched in the
+# title; ntceInsttNm and presmptPrce take field predicates. Terms combine
+# with AND (or juxtaposition), OR / | and NOT, plus parentheses.
+_QUERY_TOKEN = re.compile(
+    r"""
+    \s*(?:
+        (?P<lparen>\() | (?P<rparen>\)) | (?P<bar>\|)
+      | "(?P<phrase>[^"]*)"
+      | /(?P<regex>(?:\\.|[^/\\])+)/
+      | (?P<field>ntceInsttNm|presmptPrce)\s*(?P<op>>=|<=|!=|=|:|>|<)\s*
+        (?:"(?P<quoted>[^"]*)"|(?P<value>[^\s()|"]+))
+      | (?P<word>[^\s()|"]+)
+    )
+    """,
+    re.VERBOSE,
+)
+_QUERY_OPERATORS = {"AND", "OR", "NOT"}
+_AGENCY_OPS = {
+    ":": lambda agency, value: value in agency,
+    "=": lambda agency, value: agency == value,
+    "!=": lambda agency, value: agency != value,
+}
+_PRICE_OPS = {
+    "=": lambda price, value: price == value,
+    "!=": lambda price, value: price != value,
+    ">": lambda price, value: price > value,
+    ">=": lambda price, value: price >= value,
+    "<": lambda price, value: price < value,
+    "<=": lambda price, value: price <= value,
+}
+_INVALID_SHEET_CHARS = set("[]:*?/\\")
+
+
+def _tokenize_query(query: str) -> list[tuple]:
+    """Split ``query`` into (kind, value) tokens, merging runs of bare words into one literal."""
+    tokens = []
+    pos = 0
+    while query[pos:].strip():
+        match = _QUERY_TOKEN.match(query, pos)
+        if match is None:
+            raise ValueError(f"검색식 '{query}'을(를) 해석할 수 없습니다: {pos + 1}번째 글자")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind in ("op", "quoted", "value"):
+            kind = "field"
+        if kind == "word" and match["word"] in _QUERY_OPERATORS:
+            tokens.append((match["word"], None))
+        elif kind == "word":
+            start = match.start("word")
+            if tokens and tokens[-1][0] == "word":
+                # Keep the original spacing so legacy keywords like "농산물 납품" match as before.
+                tokens[-1] = ("word", (tokens[-1][1][0], match.end("word")))
+            else:
+                tokens.append(("word", (start, match.end("word"))))
+        elif kind == "field":
+            value = match["quoted"] if match["quoted"] is not None else match["value"]
+            tokens.append(("field", (match["field"], match["op"], value)))
+        elif kind == "phrase":
+            tokens.append(("lit", match["phrase"]))
+        elif kind == "regex":
+            tokens.append(("regex", match["regex"]))
+        else:
+            tokens.append((kind, None))
+    return [("lit", query[value[0]:value[1]]) if kind == "word" else (kind, value) for kind, value in tokens]
+
+
+class _QueryParser:
+    """Recursive-descent parser producing a nested-tuple AST; NOT binds tightest, then AND, then OR."""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.tokens = _tokenize_query(query)
+        self.pos = 0
+
+    def error(self, reason: str) -> ValueError:
+        return ValueError(f"검색식 '{self.query}'을(를) 해석할 수 없습니다: {reason}")
+
+    def peek(self) -> str | None:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def parse(self) -> tuple:
+        if not self.tokens:
+            # An empty keyword has always matched every notice.
+            return ("lit", "")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise self.error("괄호 또는 연산자가 맞지 않음")
+        return node
+
+    def parse_or(self) -> tuple:
+        children = [self.parse_and()]
+        while self.peek() in ("OR", "bar"):
+            self.pos += 1
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def parse_and(self) -> tuple:
+        children = [self.parse_not()]
+        while self.peek() not in (None, "OR", "bar", "rparen"):
+            if self.peek() == "AND":
+                self.pos += 1
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def parse_not(self) -> tuple:
+        if self.peek() == "NOT":
+            self.pos += 1
+            return ("not", self.parse_not())
+        return self.parse_atom()
+
+    def parse_atom(self) -> tuple:
+        if self.pos >= len(self.tokens):
+            raise self.error("식이 끝나지 않음")
+        kind, value = self.tokens[self.pos]
+        self.pos += 1
+        if kind == "lparen":
+            node = self.parse_or()
+            if self.peek() != "rparen":
+                raise self.error("닫는 괄호가 없음")
+            self.pos += 1
+            return node
+        if kind == "lit":
+            return ("lit", value)
+        if kind == "regex":
+            try:
+                return ("regex", re.compile(value))
+            except re.error as e:
+                raise self.error(f"정규식 오류 ({e})") from None
+        if kind == "field":
+            return ("field", *self.field_predicate(*value))
+        raise self.error(f"'{kind if value is None else value}' 위치가 잘못됨")
+
+    def field_predicate(self, field: str, op: str, value: str) -> tuple:
+        if field == "ntceInsttNm":
+            if op not in _AGENCY_OPS:
+                raise self.error(f"ntceInsttNm에는 {', '.join(_AGENCY_OPS)} 연산자만 쓸 수 있음")
+            return field, _AGENCY_OPS[op], value
+        if op not in _PRICE_OPS:
+            raise self.error(f"presmptPrce에는 {', '.join(_PRICE_OPS)} 연산자만 쓸 수 있음")
+        try:
+            return field, _PRICE_OPS[op], int(value.replace(",", "").replace("_", ""))
+        except ValueError:
+            raise self.error(f"가격 '{value}'이(가) 숫자가 아님") from None
+
+
+class KeywordQueries:
+    """Keyword-sheet queries compiled into one Aho–Corasick matcher plus small evaluators.
+
+    Every title literal of every query goes into a single automaton, so each
+    notice's title is scanned once however many sheets there are. A query
+    that cannot be true without some literal (its anchors) is only evaluated
+    when one of those literals was found; plain keywords are decided by the
+    scan alone. Only queries built around NOT, regexes or field predicates
+    run for every notice. With ``plain`` every query is taken as a plain
+    substring, operators and all.
+    """
+
+    def __init__(self, queries: dict[str, str], plain: bool = False):
+        self.names = list(queries)
+        self._literals: dict[str, int] = {}
+        self._evaluators: list[Callable | None] = []
+        unanchored: list[int] = []
+        anchored: dict[int, list[int]] = {}
+
+        for index, (name, query) in enumerate(queries.items()):
+            if _INVALID_SHEET_CHARS & set(name):
+                raise ValueError(
+                    f"시트 이름 '{name}'에 []:*?/\\ 문자를 쓸 수 없습니다. "
+                    "keywords를 {\"시트 이름\": \"검색식\"} 형태로 지정하세요."
+                )
+            node = ("lit", query) if plain else _QueryParser(query).parse()
+            self._evaluators.append(None if node[0] == "lit" else self._compile(node))
+            anchors = self._anchors(node)
+            if anchors is None:
+                unanchored.append(index)
+            for literal in anchors or ():
+                anchored.setdefault(self._literals[literal], []).append(index)
+
+        self.matcher = build_keyword_matcher(tuple(self._literals))
+        self._unanchored = unanchored
+        self._anchored = anchored
+
+    def _compile(self, node: tuple) -> Callable:
+        """Turn an AST node into ``f(hits, title, agency, price) -> bool``."""
+        kind = node[0]
+        if kind == "lit":
+            index = self._literals.setdefault(node[1], len(self._literals))
+            return lambda hits, title, agency, price: index in hits
+        if kind == "regex":
+            search = node[1].search
+            return lambda hits, title, agency, price: search(title) is not None
+        if kind == "field":
+            _, field, op, value = node
+            if field == "ntceInsttNm":
+                return lambda hits, title, agency, price: op(agency or "", value)
+            return lambda hits, title, agency, price: price is not None and op(price, value)
+        if kind == "not":
+            child = self._compile(node[1])
+            return lambda hits, title, agency, price: not child(hits, title, agency, price)
+        children = [self._compile(child) for child in node[1]]
+        combine = all if kind == "and" else any
+        return lambda hits, title, agency, price: combine(child(hits, title, agency, price) for child in children)
+
+    def _anchors(self, node: tuple) -> set[str] | None:
+        """Literals of which at least one must occur for ``node`` to hold, or None if there is no such set."""
+        kind = node[0]
+        if kind == "lit":
+            self._literals.setdefault(node[1], len(self._literals))
+            return {node[1]}
+        if kind == "and":
+            options = [anchors for anchors in map(self._anchors, node[1]) if anchors is not None]
+            return min(options, key=len) if options else None
+        if kind == "or":
+            options = [self._anchors(child) for child in node[1]]
+            return None if None in options else set().union(*options)
+        return None
+
+    def match(self, title: str, agency: str | None = None, price: int | None = None) -> list[int]:
+        """Return the indices (into ``names``) of the queries the notice satisfies."""
+        hits = self.matcher.find(title)
+        candidates = set(self._unanchored)
+        for literal in hits:
+            candidates.update(self._anchored.get(literal, ()))
+        evaluators = self._evaluators
+        return [
+            index for index in candidates
+            if evaluators[index] is None or evaluators[index](hits, title, agency, price)
+        ]
+
+
+@lru_cache(maxsize=8)
+def _compile_queries(queries: tuple[tuple[str, str], ...], plain: bool) -> KeywordQueries:
+    return KeywordQueries(dict(queries), plain)
+
+
+def compile_keyword_queries(keywords: list[str] | dict[str, str]) -> KeywordQueries:
+    """Compile the configured keyword sheets once; repeated calls with the same config are cached.
+
+    Only the ``{sheet name: query}`` form is parsed as queries. List entries
+    stay plain keywords, so ``"R&D"`` or ``"A|B"`` keep matching literally.
+    """
+    if isinstance(keywords, dict):
+        return _compile_queries(tuple(keywords.items()), False)
+    return _compile_queries(tuple((keyword, keyword) for keyword in dict.fromkeys(keywords)), True)
+
+
+def _match_keywords(
+    notices: list[BidNotice], keywords: list[str] | dict[str, str],
+) -> dict[str, list[BidNotice]]:
+    queries = compile_keyword_queries(keywords)
+    results = {name: [] for name in queries.names}
+    buckets = list(results.values())
+
+    for notice in notices:
+        for idx in queries.match(notice.bidNtceNm, notice.ntceInsttNm, notice.presmptPrce):
+            buckets[idx].append(notice)
+    return results
+
+
+def filter_by_keywords(
+    notices: list[BidNotice], keywords: list[str] | dict[str, str],
+) -> dict[str, list[BidNotice]]:
+    results = _match_keywords(notices, keywords)
+    for keyword, matched in results.items():
+        logger.info("검색어 '%s': %d건 매칭", keyword, len(matched))
+    return results
+
+
+class NoticeBatch:
+    """Columnar batch of notices for analytics over long periods (requires numpy).
+
+    Each COLUMNS field is one array: prices are int64 (with a presence mask
+    for empty values), timestamps datetime64[s] with NaT when missing, and
+    ntceInsttNm is dictionary-encoded as int32 codes into ``agencies``. The
+    filters return boolean masks that combine with ``&``/``|``/``~`` and are
+    applied with ``take`` or ``notices``.
+    """
+
+    TEXT_FIELDS = ("bidNtceNo", "bidNtceNm", "bidNtceOrd", "rbidPermsnYn", "bidNtceDtlUrl", "category")
+    PRICE_FIELDS = ("presmptPrce", "asignBdgtAmt")
+    DATETIME_FIELDS = ("bidClseDt", "bidNtceDt")
+
+    def __init__(self, columns: dict, present: dict, agency_codes, agencies: list[str]):
+        self.columns = columns
+        self.present = present
+        self.agency_codes = agency_codes
+        self.agencies = agencies
+
+    @classmethod
+    def from_notices(cls, notices: Iterable[BidNotice]) -> "NoticeBatch":
+        if np is None:
+            raise RuntimeError("컬럼 배치를 사용하려면 numpy를 설치하세요: pip install numpy")
+        notices = list(notices)
+        columns, present = {}, {}
+        for field in cls.TEXT_FIELDS:
+            columns[field] = np.array([getattr(notice, field) for notice in notices], dtype=object)
+        for field in cls.PRICE_FIELDS:
+            values = [getattr(notice, field) for notice in notices]
+            present[field] = np.array([value is not None for value in values], dtype=bool)
+            columns[field] = np.array([value or 0 for value in values], dtype=np.int64)
+        for field in cls.DATETIME_FIELDS:
+            columns[field] = np.array([getattr(notice, field) for notice in notices], dtype="datetime64[s]")
+
+        codes: dict[str, int] = {}
+        agency_codes = np.array(
+            [codes.setdefault(notice.ntceInsttNm, len(codes)) for notice in notices], dtype=np.int32,
+        )
+        return cls(columns, present, agency_codes, list(codes))
+
+    def __len__(self) -> int:
+        return len(self.agency_codes)
+
+    def between(self, field: str, low=None, high=None):
+        """Mask of rows whose price or timestamp ``field`` lies in [low, high]; missing values never match.
+
+        Timestamp bounds may be naive (KST wall time) or timezone-aware datetimes.
+        """
+        values = self.columns[field]
+        if field in self.DATETIME_FIELDS:
+            mask = ~np.isnat(values)
+            low, high = (
+                None if bound is None else np.datetime64(_naive_kst(bound), "s") for bound in (low, high)
+            )
+        else:
+            mask = self.present[field].copy()
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def agency_in(self, names: Iterable[str]):
+        """Mask of rows posted by any of the agencies in ``names``."""
+        index = {agency: code for code, agency in enumerate(self.agencies)}
+        wanted = [index[name] for name in names if name in index]
+        return np.isin(self.agency_codes, wanted)
+
+    def keyword_masks(self, keywords: list[str] | dict[str, str]) -> dict:
+        """Return one boolean mask per keyword sheet from a single Aho–Corasick pass over the titles."""
+        queries = compile_keyword_queries(keywords)
+        masks = np.zeros((len(queries.names), len(self)), dtype=bool)
+        prices = np.where(self.present["presmptPrce"], self.columns["presmptPrce"], -1).tolist()
+        for row, (title, code, price) in enumerate(
+            zip(self.columns["bidNtceNm"], self.agency_codes.tolist(), prices)
+        ):
+            for idx in queries.match(title, self.agencies[code], price if price >= 0 else None):
+                masks[idx, row] = True
+        return dict(zip(queries.names, masks))
+
+    def take(self, mask) -> "NoticeBatch":
+        """Return the rows selected by a boolean mask (or index array) as a new batch."""
+        return NoticeBatch(
+            {field: values[mask] for field, values in self.columns.items()},
+            {field: values[mask] for field, values in self.present.items()},
+            self.agency_codes[mask],
+            self.agencies,
+        )
+
+    def notices(self, mask=None) -> list[BidNotice]:
+        """Materialize (the masked) rows back into BidNotice records, e.g. for the report writers."""
+        batch = self if mask is None else self.take(mask)
+        # tolist() yields Python ints and datetime.datetime (None for NaT).
+        fields = {field: values.tolist() for field, values in batch.columns.items()}
+        for field, present in batch.present.items():
+            fields[field] = [
+                value if ok else None for value, ok in zip(fields[field], present.tolist())
+            ]
+        fields["ntceInsttNm"] = [self.agencies[code] for code in batch.agency_codes.tolist()]
+        return [
+            BidNotice(**{field: fields[field][row] for field, _ in COLUMNS})
+            for row in range(len(batch))
+        ]
+
+
+def _naive_kst(value: datetime) -> datetime:
+    return value.astimezone(KST).replace(tzinfo=None) if value.tzinfo else value
+
+
+def filter_batch_by_keywords(batch: NoticeBatch, keywords: list[str] | dict[str, str]) -> dict[str, list[BidNotice]]:
+    """Columnar counterpart of filter_by_keywords, with the same result shape for write_excel."""
+    results = {keyword: batch.notices(mask) for keyword, mask in batch.keyword_masks(keywords).items()}
+    for keyword, matched in results.items():
+        logger.info("검색어 '%s': %d건 매칭", keyword, len(matched))
+    return results
+
+
+REVISION_MODES = ("off", "latest", "grouped")
+
+
+def _revision_order(notice: BidNotice) -> int:
+    return int(notice.bidNtceOrd) if notice.bidNtceOrd.isdigit() else -1
+
+
+def resolve_revisions(notices: list[BidNotice], mode: str) -> list[BidNotice]:
+    """Resolve the bidNtceOrd revisions (정정공고) of each bidNtceNo with one hash-index pass.
+
+    "latest" keeps only the highest order, "grouped" keeps every order but
+    places them together, latest first, and "off" returns ``notices`` as is.
+    The latest notice of each group records how many earlier orders it
+    supersedes, for the 요약 sheet.
+    """
+    if mode == "off":
+        return notices
+    if mode not in REVISION_MODES:
+        raise ValueError(f"알 수 없는 차수 정리 방식입니다: {mode} (사용 가능: {', '.join(REVISION_MODES)})")
+
+    groups: dict[Any, list[BidNotice]] = {}
+    for notice in notices:
+        groups.setdefault(notice.bidNtceNo or id(notice), []).append(notice)
+
+    resolved = []
+    for group in groups.values():
+        if len(group) > 1:
+            group.sort(key=_revision_order, reverse=True)
+        for notice in group:
+            notice.superseded = 0
+        group[0].superseded = len(group) - 1
+        if mode == "latest":
+            resolved.append(group[0])
+        else:
+            resolved.extend(group)
+
+    logger.info(
+        "공고 차수 정리(%s): 공고 %d건, 이전 차수 %d건",
+        mode, len(groups), len(notices) - len(groups),
+    )
+    return resolved
+
+
+CHANGE_NEW = "신규"
+CHANGE_AMENDED = "정정"
+CHANGE_UNCHANGED = "변동없음"
+CHANGE_COLUMN = ("change", "변경구분")
+
+
+def _content_hash(notice: BidNotice) -> str:
+    payload = json.dumps(list(notice.as_item().values()), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_seen(state_dir: Path) -> dict[str, list[str]]:
+    """Load the seen-set: "bidNtceNo/bidNtceOrd" -> [content hash, notice date YYYYMMDD]."""
+    path = state_dir / "seen.json.gz"
+    if not path.exists():
+        return {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_seen(state_dir: Path, seen: dict[str, list[str]], retention_days: int) -> None:
+    """Persist the seen-set, forgetting notices posted more than ``retention_days`` ago."""
+    cutoff = (datetime.now(KST) - timedelta(days=retention_days)).strftime("%Y%m%d")
+    seen = {key: entry for key, entry in seen.items() if not entry[1] or entry[1] >= cutoff}
+    state_dir.mkdir(parents=True, exist_ok=True)
+    path = state_dir / "seen.json.gz"
+    tmp_path = path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(seen, f, separators=(",", ":"))
+    tmp_path.replace(path)
+
+
+def classify_changes(notices: list[BidNotice], seen: dict[str, list[str]]) -> Counter:
+    """Flag each notice as 신규, 정정 or 변동없음 against ``seen`` and record it there.
+
+    A known (bidNtceNo, bidNtceOrd) whose content hash changed, or a new order
+    of a known bidNtceNo, counts as 정정. Each notice costs one hash and a few
+    dict/set lookups, so this stays cheap on large backfills.
+    """
+    known_numbers = {key.split("/", 1)[0] for key in seen}
+    counts = Counter()
+    for notice in notices:
+        key = f"{notice.bidNtceNo}/{notice.bidNtceOrd}"
+        digest = _content_hash(notice)
+        previous = seen.get(key)
+        if previous is not None:
+            notice.change = CHANGE_UNCHANGED if previous[0] == digest else CHANGE_AMENDED
+        else:
+            notice.change = CHANGE_AMENDED if notice.bidNtceNo in known_numbers else CHANGE_NEW
+        seen[key] = [digest, notice.bidNtceDt.strftime("%Y%m%d") if notice.bidNtceDt else ""]
+        counts[notice.change] += 1
+    logger.info(
+        "변경 감지: 신규 %d건, 정정 %d건, 변동없음 %d건",
+        counts[CHANGE_NEW], counts[CHANGE_AMENDED], counts[CHANGE_UNCHANGED],
+    )
+    return counts
+
+
+def build_report(
+    notices: list[BidNotice], keywords: list[str] | dict[str, str], config: dict,
+    seen: dict[str, list[str]] | None = None,
+) -> dict[str, list[BidNotice]]:
+    """Resolve revisions, flag changes against ``seen`` (if given) and match keywords.
+
+    Every match is returned; ``change_tracking.delta_only`` is applied per
+    sink by write_outputs.
+    """
+    notices = resolve_revisions(notices, config.get("revisions", "off"))
+    if seen is not None:
+        classify_changes(notices, seen)
+    return filter_by_keywords(notices, keywords)
+
+
+def _delta_only(filtered: dict[str, list[BidNotice]]) -> dict[str, list[BidNotice]]:
+    """Keep only the 신규 / 정정 matches."""
+    return {
+        keyword: [notice for notice in matched if notice.change != CHANGE_UNCHANGED]
+        for keyword, matched in filtered.items()
+    }
+
+
+def _row_values(notice: BidNotice, columns: list[tuple[str, str]] = COLUMNS) -> list:
+    """Convert one notice into the cell values of a keyword sheet row."""
+    values = []
+    for field, _ in columns:
+        value = getattr(notice, field)
+        if value is None:
+            value = ""
+        elif isinstance(value, datetime):
+            value = value.strftime(API_DATETIME_FORMAT)
+        values.append(value)
+    return values
+
+
+def _header_styles() -> tuple[Font, PatternFill, Alignment]:
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
+    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    return header_font, header_fill, header_align
+
+
+REPORT_NAME = "g2b_용역공고"
+
+
+def _report_name(config: dict) -> str:
+    """File name prefix for the configured categories: g2b_물품공고 for one, g2b_입찰공고 for several."""
+    categories = _categories(config)
+    return f"g2b_{categories[0]}공고" if len(categories) == 1 else "g2b_입찰공고"
+
+
+def _report_path(date_str: str, output_dir: Path, suffix: str = ".xlsx", report_name: str = REPORT_NAME) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / f"{report_name}_{date_str}{suffix}"
+
+
+def _display_width(text: str) -> int:
+    """Width of ``text`` in Excel character units; Hangul and other wide glyphs count double."""
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+def _header_widths(columns: list[tuple[str, str]] = COLUMNS) -> list[int]:
+    return [_display_width(col_name) for _, col_name in columns]
+
+
+def _update_widths(widths: list[int], values: list) -> None:
+    """Widen ``widths`` (display width, capped at 60) to fit one row of values."""
+    for col_idx, value in enumerate(values):
+        if value:
+            widths[col_idx] = max(widths[col_idx], min(_display_width(str(value)), 60))
+
+
+def _summary_header(superseded: dict[str, int] | None) -> list[str]:
+    header = ["검색어", "건수", "조회일자"]
+    if superseded is not None:
+        header.append("정리된 이전 차수")
+    return header
+
+
+def _save_write_only(
+    filepath: Path, date_str: str, sheets: list[tuple[str, int, list[int], Iterable[list]]],
+    superseded: dict[str, int] | None = None, columns: list[tuple[str, str]] = COLUMNS,
+) -> None:
+    """Save a report through openpyxl's write-only (streaming) workbook.
+
+    ``sheets`` holds (keyword, row count, column widths, row values) per
+    keyword sheet. Column widths and freeze panes must be set before the
+    first row is appended, so callers work out the widths beforehand.
+    ``superseded`` adds the per-keyword count of collapsed revisions to 요약.
+    """
+    header_font, header_fill, header_align = _header_styles()
+    wb = Workbook(write_only=True)
+
+    ws_summary = wb.create_sheet(title="요약")
+    ws_summary.column_dimensions["A"].width = 20
+    ws_summary.column_dimensions["B"].width = 10
+    ws_summary.column_dimensions["C"].width = 15
+    if superseded is not None:
+        ws_summary.column_dimensions["D"].width = 18
+    summary_header = []
+    for value in _summary_header(superseded):
+        cell = WriteOnlyCell(ws_summary, value=value)
+        cell.font = Font(bold=True)
+        summary_header.append(cell)
+    ws_summary.append(summary_header)
+    for keyword, count, _, _ in sheets:
+        row = [keyword, count, date_str]
+        if superseded is not None:
+            row.append(superseded[keyword])
+        ws_summary.append(row)
+
+    for keyword, _, widths, rows in sheets:
+        ws = wb.create_sheet(title=keyword)
+        for col_idx, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width + 4
+        ws.freeze_panes = "A2"
+
+        header = []
+        for _, col_name in columns:
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+            header.append(cell)
+        ws.append(header)
+        for values in rows:
+            ws.append(values)
+
+    wb.save(filepath)
+
+
+def write_excel(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    write_only: bool = False, date_str: str | None = None, revision_summary: bool = False,
+    change_flags: bool = False, report_name: str = REPORT_NAME,
+) -> Path:
+    """Write one sheet per keyword plus the 요약 sheet.
+
+    With ``write_only`` the workbook is streamed with whole-row appends instead
+    of materializing every cell, which keeps large reports fast and small.
+    ``date_str`` overrides the YYYYMMDD label used in the file name and 요약
+    sheet (e.g. a date range for merged backfill reports). ``revision_summary``
+    adds how many earlier revisions resolve_revisions collapsed per keyword,
+    and ``change_flags`` a 변경구분 column from classify_changes.
+    ``report_name`` is the file name prefix (see _report_name).
+    """
+    date_str = date_str or target_date.strftime("%Y%m%d")
+    filepath = _report_path(date_str, output_dir, report_name=report_name)
+    columns = [*COLUMNS, CHANGE_COLUMN] if change_flags else COLUMNS
+    superseded = None
+    if revision_summary:
+        superseded = {
+            keyword: sum(notice.superseded for notice in notices) for keyword, notices in filtered.items()
+        }
+
+    if write_only:
+        sheets = []
+        for keyword, items in filtered.items():
+            rows = [_row_values(item, columns) for item in items]
+            widths = _header_widths(columns)
+            for values in rows:
+                _update_widths(widths, values)
+            sheets.append((keyword, len(items), widths, rows))
+        _save_write_only(filepath, date_str, sheets, superseded, columns)
+        logger.info("엑셀 저장 완료: %s", filepath)
+        return filepath
+
+    wb = Workbook()
+    # Remove default sheet
+    wb.remove(wb.active)
+
+    header_font, header_fill, header_align = _header_styles()
+
+    for keyword, items in filtered.items():
+        ws = wb.create_sheet(title=keyword)
+
+        # Write header
+        for col_idx, (_, col_name) in enumerate(columns, 1):
+            cell = ws.cell(row=1, column=col_idx, value=col_name)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+
+        # Write data, auto-fitting column widths (approximate) as we go
+        widths = _header_widths(columns)
+        for row_idx, item in enumerate(items, 2):
+            values = _row_values(item, columns)
+            _update_widths(widths, values)
+            for col_idx, value in enumerate(values, 1):
+                ws.cell(row=row_idx, column=col_idx, value=value)
+
+        for col_idx, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width + 4
+
+        # Freeze header row
+        ws.freeze_panes = "A2"
+
+    # Add summary sheet
+    ws_summary = wb.create_sheet(title="요약", index=0)
+    for col_idx, value in enumerate(_summary_header(superseded), 1):
+        ws_summary.cell(row=1, column=col_idx, value=value).font = Font(bold=True)
+    for idx, (keyword, items) in enumerate(filtered.items(), 2):
+        ws_summary.cell(row=idx, column=1, value=keyword)
+        ws_summary.cell(row=idx, column=2, value=len(items))
+        ws_summary.cell(row=idx, column=3, value=date_str)
+        if superseded is not None:
+            ws_summary.cell(row=idx, column=4, value=superseded[keyword])
+    ws_summary.column_dimensions["A"].width = 20
+    ws_summary.column_dimensions["B"].width = 10
+    ws_summary.column_dimensions["C"].width = 15
+    if superseded is not None:
+        ws_summary.column_dimensions["D"].width = 18
+
+    wb.save(filepath)
+    logger.info("엑셀 저장 완료: %s", filepath)
+    return filepath
+
+
+def _arrow_schema():
+    dictionary_type = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "ntceInsttNm": dictionary_type,
+        "presmptPrce": pa.int64(),
+        "asignBdgtAmt": pa.int64(),
+        # Timezone-aware, so readers do not take the KST wall time for UTC. Parquet
+        # has no second-resolution timestamps, so use ms for both formats.
+        "bidClseDt": pa.timestamp("ms", tz="Asia/Seoul"),
+        "bidNtceDt": pa.timestamp("ms", tz="Asia/Seoul"),
+        "category": dictionary_type,
+    }
+    fields = [pa.field("keyword", dictionary_type)]
+    fields += [pa.field(field, types.get(field, pa.string())) for field, _ in COLUMNS]
+    fields.append(pa.field("notice_date", pa.date32()))
+    labels = {"keyword": "검색어", **dict(COLUMNS), "notice_date": "공고일자"}
+    return pa.schema(fields, metadata={"labels": json.dumps(labels, ensure_ascii=False)})
+
+
+def _arrow_table(filtered: dict[str, list[BidNotice]]):
+    """Flatten the keyword results into one Arrow table (a notice appears once per matching keyword)."""
+    if pa is None:
+        raise RuntimeError("Parquet/Arrow 출력을 사용하려면 pyarrow를 설치하세요: pip install pyarrow")
+    rows = [(keyword, notice) for keyword, notices in filtered.items() for notice in notices]
+    columns = {"keyword": [keyword for keyword, _ in rows]}
+    for field, _ in COLUMNS:
+        columns[field] = [getattr(notice, field) for _, notice in rows]
+    for field in ("bidClseDt", "bidNtceDt"):
+        # BidNotice keeps naive KST wall time; a naive value would be stored as UTC.
+        columns[field] = [value.replace(tzinfo=KST) if value else None for value in columns[field]]
+    columns["notice_date"] = [notice.bidNtceDt.date() if notice.bidNtceDt else None for _, notice in rows]
+    return pa.table(columns, schema=_arrow_schema())
+
+
+def write_parquet(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    date_str: str | None = None,
+) -> Path:
+    """Write the keyword results into the Parquet dataset under ``output/parquet``.
+
+    The dataset is hive-partitioned by notice date (``notice_date=YYYY-MM-DD``)
+    and shared by every run: the partitions written now replace the same days
+    from earlier runs, so a day is always read from the freshest fetch.
+    """
+    table = _arrow_table(filtered)
+    dataset_dir = output_dir / "parquet"
+    pa_dataset.write_dataset(
+        table, dataset_dir, format="parquet",
+        partitioning=pa_dataset.partitioning(pa.schema([table.schema.field("notice_date")]), flavor="hive"),
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+    )
+    logger.info("Parquet 저장 완료: %s (%d행)", dataset_dir, table.num_rows)
+    return dataset_dir
+
+
+def write_arrow(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    date_str: str | None = None, report_name: str = REPORT_NAME,
+) -> Path:
+    """Write the keyword results as one Arrow IPC (Feather v2) file next to the Excel report."""
+    filepath = _report_path(date_str or target_date.strftime("%Y%m%d"), output_dir, ".arrow", report_name)
+    table = _arrow_table(filtered)
+    with pa.OSFile(str(filepath), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    logger.info("Arrow 저장 완료: %s", filepath)
+    return filepath
+
+
+def _record(keyword: str, notice: BidNotice) -> dict:
+    """One keyword match as a flat, JSON/SQL-friendly dict: int prices, API-format timestamps, None when empty."""
+    record = {"keyword": keyword}
+    for field, _ in COLUMNS:
+        value = getattr(notice, field)
+        if isinstance(value, datetime):
+            value = value.strftime(API_DATETIME_FORMAT)
+        record[field] = value if value != "" else None
+    return record
+
+
+def write_csv(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    date_str: str | None = None, report_name: str = REPORT_NAME,
+) -> Path:
+    """Write every keyword match as one CSV row (UTF-8 with BOM so Excel opens Hangul correctly)."""
+    filepath = _report_path(date_str or target_date.strftime("%Y%m%d"), output_dir, ".csv", report_name)
+    with open(filepath, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["검색어", *(col_name for _, col_name in COLUMNS)])
+        for keyword, notices in filtered.items():
+            for notice in notices:
+                writer.writerow([keyword, *_row_values(notice)])
+    logger.info("CSV 저장 완료: %s", filepath)
+    return filepath
+
+
+def write_jsonl(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    date_str: str | None = None, report_name: str = REPORT_NAME,
+) -> Path:
+    """Write every keyword match as one JSON object per line."""
+    filepath = _report_path(date_str or target_date.strftime("%Y%m%d"), output_dir, ".jsonl", report_name)
+    with open(filepath, "w", encoding="utf-8") as f:
+        for keyword, notices in filtered.items():
+            for notice in notices:
+                f.write(json.dumps(_record(keyword, notice), ensure_ascii=False))
+                f.write("\n")
+    logger.info("JSON Lines 저장 완료: %s", filepath)
+    return filepath
+
+
+def write_sqlite(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path,
+    date_str: str | None = None, report_name: str = REPORT_NAME,
+) -> Path:
+    """Write the keyword matches into a standalone SQLite report (table ``matches``), replacing any earlier one."""
+    filepath = _report_path(date_str or target_date.strftime("%Y%m%d"), output_dir, ".db", report_name)
+    fields = ["keyword", *(field for field, _ in COLUMNS)]
+    types = {"presmptPrce": "INTEGER", "asignBdgtAmt": "INTEGER"}
+    columns = ", ".join(f"{field} {types.get(field, 'TEXT')}" for field in fields)
+    with closing(sqlite3.connect(filepath)) as conn, conn:
+        conn.execute("DROP TABLE IF EXISTS matches")
+        conn.execute(f"CREATE TABLE matches ({columns})")
+        conn.executemany(
+            f"INSERT INTO matches VALUES ({', '.join('?' * len(fields))})",
+            (
+                tuple(_record(keyword, notice).values())
+                for keyword, notices in filtered.items() for notice in notices
+            ),
+        )
+        conn.execute("CREATE INDEX idx_matches_keyword ON matches (keyword)")
+    logger.info("SQLite 저장 완료: %s", filepath)
+    return filepath
+
+
+OutputSink = Callable[[dict[str, list[BidNotice]], datetime, Path, str | None], Path]
+
+# Output formats selectable through config["outputs"]; every sink gets the same
+# keyword results and returns the path it wrote.
+OUTPUT_SINKS: dict[str, OutputSink] = {
+    "excel": write_excel,
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "sqlite": write_sqlite,
+    "parquet": write_parquet,
+    "arrow": write_arrow,
+}
+
+# Sinks that replace stored data (the Parquet dataset swaps whole day
+# partitions) always get every match, even with change_tracking.delta_only;
+# given only the changes, they would drop the unchanged notices they hold.
+SNAPSHOT_SINKS = {"parquet"}
+
+
+def write_outputs(
+    filtered: dict[str, list[BidNotice]], target_date: datetime, output_dir: Path, config: dict,
+    date_str: str | None = None,
+) -> list[Path]:
+    """Write the keyword results with every sink in ``config["outputs"]`` (default: Excel only).
+
+    The sinks only read the shared results, so they run side by side in a
+    thread pool and the slowest one bounds the runtime. Paths come back in
+    the configured order. With ``change_tracking.delta_only`` every sink
+    except those in SNAPSHOT_SINKS only gets the 신규 / 정정 matches.
+    """
+    report_name = _report_name(config)
+    change_tracking = config.get("change_tracking", {})
+    delta = None
+    if change_tracking.get("enabled", False) and change_tracking.get("delta_only", False):
+        delta = _delta_only(filtered)
+        logger.info("변경분만 기록: %d건", sum(len(matched) for matched in delta.values()))
+
+    sinks = []
+    for name in dict.fromkeys(config.get("outputs", ["excel"])):
+        if name not in OUTPUT_SINKS:
+            raise ValueError(f"알 수 없는 출력 형식입니다: {name} (사용 가능: {', '.join(OUTPUT_SINKS)})")
+        sink = OUTPUT_SINKS[name]
+        if sink is write_excel:
+            sink = partial(
+                write_excel,
+                write_only=config.get("excel_write_only", False),
+                revision_summary=config.get("revisions", "off") != "off",
+                change_flags=config.get("change_tracking", {}).get("enabled", False),
+                report_name=report_name,
+            )
+        elif sink in (write_arrow, write_csv, write_jsonl, write_sqlite):
+            sink = partial(sink, report_name=report_name)
+        sinks.append((sink, filtered if delta is None or name in SNAPSHOT_SINKS else delta))
+
+    if len(sinks) == 1:
+        sink, results = sinks[0]
+        return [sink(results, target_date, output_dir, date_str=date_str)]
+    with ThreadPoolExecutor(max_workers=len(sinks)) as pool:
+        futures = [
+            pool.submit(sink, results, target_date, output_dir, date_str=date_str)
+            for sink, results in sinks
+        ]
+        return [future.result() for future in futures]
+
+
+def open_store(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the local SQLite store of every fetched notice."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS notices (
+            bidNtceNo   TEXT NOT NULL,
+            bidNtceOrd  TEXT NOT NULL,
+            bidNtceNm   TEXT,
+            ntceInsttNm TEXT,
+            bidNtceDt   TEXT,
+            bidClseDt   TEXT,
+            category    TEXT,
+            raw         TEXT NOT NULL,
+            fetched_at  TEXT NOT NULL,
+            PRIMARY KEY (bidNtceNo, bidNtceOrd)
+        );
+        CREATE INDEX IF NOT EXISTS idx_notices_bidNtceDt ON notices (bidNtceDt);
+        CREATE INDEX IF NOT EXISTS idx_notices_bidClseDt ON notices (bidClseDt);
+        CREATE INDEX IF NOT EXISTS idx_notices_ntceInsttNm ON notices (ntceInsttNm);
+        -- Inverted index: title character bigram -> notices.rowid.
+        CREATE TABLE IF NOT EXISTS title_bigrams (
+            gram      TEXT NOT NULL,
+            notice_id INTEGER NOT NULL,
+            PRIMARY KEY (gram, notice_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_title_bigrams_notice_id ON title_bigrams (notice_id);
+    """)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+        # Stores created before the title index existed get it built once.
+        with conn:
+            conn.execute("DELETE FROM title_bigrams")
+            conn.executemany(
+                "INSERT OR IGNORE INTO title_bigrams (gram, notice_id) VALUES (?, ?)",
+                (
+                    (gram, notice_id)
+                    for notice_id, title in conn.execute("SELECT rowid, bidNtceNm FROM notices").fetchall()
+                    for gram in _title_grams(title or "")
+                ),
+            )
+            conn.execute("PRAGMA user_version = 1")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+        # Stores created before categories were stored get the column filled from the raw items.
+        with conn:
+            if "category" not in {row[1] for row in conn.execute("PRAGMA table_info(notices)")}:
+                conn.execute("ALTER TABLE notices ADD COLUMN category TEXT")
+            conn.executemany(
+                "UPDATE notices SET category = ? WHERE rowid = ?",
+                (
+                    (json.loads(raw).get("category") or "용역", notice_id)
+                    for notice_id, raw in conn.execute("SELECT rowid, raw FROM notices").fetchall()
+                ),
+            )
+            conn.execute("PRAGMA user_version = 2")
+    return conn
+
+
+def _title_grams(title: str) -> set[str]:
+    """Case-folded character bigrams of ``title``, ignoring whitespace.
+
+    Korean titles have no reliable word boundaries, so the index works on
+    characters; dropping whitespace keeps every substring's bigrams a subset
+    of its title's.
+    """
+    text = "".join(title.casefold().split())
+    return {text[idx:idx + 2] for idx in range(len(text) - 1)}
+
+
+def _index_titles(conn: sqlite3.Connection, items: list[dict], previous: dict) -> None:
+    """Refresh the bigram postings of upserted notices whose title is new or changed."""
+    stale, postings = [], []
+    # The upsert keeps the last duplicate of a key, so index that one.
+    for key, item in {_notice_key(item): item for item in items}.items():
+        title = item.get("bidNtceNm") or ""
+        old = previous.get(key)
+        if old is not None:
+            notice_id, old_title = old
+            if old_title == title:
+                continue
+            stale.append((notice_id,))
+        else:
+            (notice_id,) = conn.execute(
+                "SELECT rowid FROM notices WHERE bidNtceNo = ? AND bidNtceOrd = ?", key,
+            ).fetchone()
+        postings.extend((gram, notice_id) for gram in _title_grams(title))
+    conn.executemany("DELETE FROM title_bigrams WHERE notice_id = ?", stale)
+    conn.executemany("INSERT OR IGNORE INTO title_bigrams (gram, notice_id) VALUES (?, ?)", postings)
+
+
+def upsert_notices(conn: sqlite3.Connection, items: list[dict]) -> None:
+    """Insert or refresh one page of notices, and their title index entries, in a single transaction."""
+    fetched_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+    rows = [
+        (
+            *_notice_key(item),
+            item.get("bidNtceNm"),
+            item.get("ntceInsttNm"),
+            item.get("bidNtceDt"),
+            item.get("bidClseDt"),
+            item.get("category") or "용역",
+            json.dumps(item, ensure_ascii=False),
+            fetched_at,
+        )
+        for item in items
+    ]
+    with conn:
+        previous = {}
+        for key in dict.fromkeys(row[:2] for row in rows):
+            found = conn.execute(
+                "SELECT rowid, bidNtceNm FROM notices WHERE bidNtceNo = ? AND bidNtceOrd = ?", key,
+            ).fetchone()
+            if found is not None:
+                previous[key] = found
+        conn.executemany(
+            """
+            INSERT INTO notices
+                (bidNtceNo, bidNtceOrd, bidNtceNm, ntceInsttNm, bidNtceDt, bidClseDt, category, raw, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (bidNtceNo, bidNtceOrd) DO UPDATE SET
+                bidNtceNm = excluded.bidNtceNm,
+                ntceInsttNm = excluded.ntceInsttNm,
+                bidNtceDt = excluded.bidNtceDt,
+                bidClseDt = excluded.bidClseDt,
+                category = excluded.category,
+                raw = excluded.raw,
+                fetched_at = excluded.fetched_at
+            """,
+            rows,
+        )
+        _index_titles(conn, items, previous)
+
+
+def query_notices(conn: sqlite3.Connection, since: str, categories: list[str] | None = None) -> list[dict]:
+    """Return stored notices posted at or after ``since`` (YYYYMMDDHHMM).
+
+    ``categories`` limits the result to those 업무구분; the store keeps every
+    category ever fetched, including backfills.
+    """
+    since_dt = f"{since[:4]}-{since[4:6]}-{since[6:8]} {since[8:10]}:{since[10:12]}"
+    if categories is None:
+        rows = conn.execute(
+            "SELECT raw FROM notices WHERE bidNtceDt >= ? ORDER BY bidNtceDt",
+            (since_dt,),
+        )
+    else:
+        placeholders = ", ".join("?" * len(categories))
+        rows = conn.execute(
+            f"SELECT raw FROM notices WHERE bidNtceDt >= ? AND category IN ({placeholders}) ORDER BY bidNtceDt",
+            (since_dt, *categories),
+        )
+    return [json.loads(raw) for (raw,) in rows]
+
+
+def search_notices(conn: sqlite3.Connection, query: str, limit: int = 100) -> list[dict]:
+    """Return stored notices whose title contains ``query`` (case-insensitive), newest first.
+
+    Candidates come from intersecting the posting lists of the query's
+    bigrams and are then verified with a real substring test, so the result
+    is exact. Single-character queries have no bigram and fall back to a scan.
+    """
+    needle = query.strip().casefold()
+    if not needle:
+        return []
+    grams = _title_grams(needle)
+    if grams:
+        placeholders = ", ".join("?" * len(grams))
+        rows = conn.execute(
+            f"""
+            SELECT n.raw, n.bidNtceNm FROM notices AS n
+            JOIN (
+                SELECT notice_id FROM title_bigrams WHERE gram IN ({placeholders})
+                GROUP BY notice_id HAVING COUNT(*) = ?
+            ) AS hit ON n.rowid = hit.notice_id
+            ORDER BY n.bidNtceDt DESC
+            """,
+            (*grams, len(grams)),
+        )
+    else:
+        rows = conn.execute("SELECT raw, bidNtceNm FROM notices ORDER BY bidNtceDt DESC")
+
+    results = []
+    for raw, title in rows:
+        if needle in (title or "").casefold():
+            results.append(json.loads(raw))
+            if len(results) >= limit:
+                break
+    return results
+
+
+def _load_seen_set(config: dict) -> dict[str, list[str]] | None:
+    if not config.get("change_tracking", {}).get("enabled", False):
+        return None
+    return load_seen(_state_dir(config))
+
+
+def _save_seen_set(config: dict, seen: dict[str, list[str]] | None) -> None:
+    if seen is not None:
+        save_seen(_state_dir(config), seen, config.get("change_tracking", {}).get("retention_days", 30))
+
+
+def _store_path(config: dict) -> Path | None:
+    store = config.get("store", {})
+    if not store.get("enabled", False):
+        return None
+    return _state_dir(config) / store.get("path", "notices.db")
+
+
+class ExcelStreamWriter:
+    """Build the keyword report incrementally from a stream of matched notices.
+
+    Rows are spooled to per-keyword temporary files as they arrive, so memory
+    stays flat however large the window is. ``close`` then writes the same
+    workbook as write_excel (요약 sheet first, styled and frozen headers) with
+    openpyxl's write-only mode, streaming the rows back from the spool.
+    """
+
+    def __init__(
+        self, keywords: list[str] | dict[str, str], target_date: datetime, output_dir: Path,
+        report_name: str = REPORT_NAME,
+    ):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.target_date = target_date
+        self.output_dir = output_dir
+        self.report_name = report_name
+        self.counts = {keyword: 0 for keyword in self.keywords}
+        self._widths = {keyword: _header_widths() for keyword in self.keywords}
+        self._spool_dir = tempfile.TemporaryDirectory(prefix="g2b_")
+        self._spools = {}
+
+    def add(self, keyword: str, notices: list[BidNotice]) -> None:
+        if not notices:
+            return
+        spool = self._spools.get(keyword)
+        if spool is None:
+            path = Path(self._spool_dir.name) / f"{self.keywords.index(keyword)}.jsonl"
+            spool = self._spools[keyword] = open(path, "w", encoding="utf-8")
+
+        widths = self._widths[keyword]
+        for notice in notices:
+            values = _row_values(notice)
+            _update_widths(widths, values)
+            spool.write(json.dumps(values, ensure_ascii=False))
+            spool.write("\n")
+        self.counts[keyword] += len(notices)
+
+    def _iter_rows(self, keyword: str):
+        spool = self._spools.get(keyword)
+        if spool is None:
+            return
+        spool.close()
+        with open(spool.name, "r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def close(self) -> Path:
+        date_str = self.target_date.strftime("%Y%m%d")
+        filepath = _report_path(date_str, self.output_dir, report_name=self.report_name)
+        sheets = [
+            (keyword, self.counts[keyword], self._widths[keyword], self._iter_rows(keyword))
+            for keyword in self.keywords
+        ]
+        try:
+            _save_write_only(filepath, date_str, sheets)
+        finally:
+            for spool in self._spools.values():
+                spool.close()
+            self._spool_dir.cleanup()
+
+        logger.info("엑셀 저장 완료: %s", filepath)
+        return filepath
+
+
+def run_streaming(
+    api_key: str, config: dict, keywords: list[str] | dict[str, str], target_date: datetime, output_dir: Path,
+    store: sqlite3.Connection | None = None,
+) -> Path | None:
+    """Fetch, filter and write the report page by page without holding the window in memory."""
+    writer = ExcelStreamWriter(keywords, target_date, output_dir, _report_name(config))
+    total = 0
+    for page_items in iter_bids(api_key, config, target_date):
+        total += len(page_items)
+        if store is not None:
+            upsert_notices(store, page_items)
+        for keyword, matched in _match_keywords(to_notices(page_items), keywords).items():
+            writer.add(keyword, matched)
+
+    logger.info("총 %d건 조회 완료", total)
+    for keyword, count in writer.counts.items():
+        logger.info("검색어 '%s': %d건 매칭", keyword, count)
+    if total == 0:
+        logger.info("조회된 공고가 없어 엑셀을 생성하지 않습니다.")
+        return None
+    return writer.close()
+
+
+def collect_incremental(
+    api_key: str, config: dict, target_date: datetime, engine: str, full: bool = False,
+    store: sqlite3.Connection | None = None,
+) -> list[BidNotice]:
+    """Fetch only what changed since the last successful run and merge it with history.
+
+    When a SQLite store is given, history is read back from it (fresh pages are
+    upserted as they arrive) instead of from ``history.json.gz``.
+    """
+    state_dir = _state_dir(config)
+    checkpoint = None if full else load_checkpoint(state_dir)
+    begin_date = incremental_begin(config, target_date, checkpoint)
+
+    on_page = partial(upsert_notices, store) if store is not None else None
+    items, complete = collect_bids(api_key, config, target_date, engine, begin_date, on_page)
+    window = build_params(config, target_date)
+    window_begin = window["inqryBgnDt"]
+    if begin_date is not None:
+        if store is not None:
+            history = to_notices(query_notices(store, window_begin, _categories(config)))
+        else:
+            history = load_history(state_dir)
+        items = merge_items(history, items, window_begin)
+        logger.info("이전 수집분과 병합: 총 %d건", len(items))
+
+    if complete:
+        if store is None:
+            save_history(state_dir, items)
+        # Only what was actually queried is covered: an end_hour earlier than
+        # the run time leaves the rest of the day for the next delta.
+        save_checkpoint(state_dir, {
+            "inqry_end_dt": min(target_date.strftime("%Y%m%d%H%M"), window["inqryEndDt"]),
+            "last_bid_ntce_dt": max(
+                (notice.bidNtceDt.strftime(API_DATETIME_FORMAT) for notice in items if notice.bidNtceDt),
+                default="",
+            ),
+            "query": _query_signature(config),
+            "history": _history_source(config),
+        })
+    else:
+        logger.warning("조회가 완료되지 않아 체크포인트를 갱신하지 않습니다.")
+    return items
+
+
+def shard_windows(begin: datetime, end: datetime, shard_hours: int) -> list[tuple[datetime, datetime]]:
+    """Split [begin, end] into consecutive, non-overlapping windows of ``shard_hours``."""
+    step = timedelta(hours=shard_hours)
+    windows = []
+    shard_begin = begin
+    while shard_begin <= end:
+        shard_end = min(shard_begin + step - timedelta(minutes=1), end)
+        windows.append((shard_begin, shard_end))
+        shard_begin += step
+    return windows
+
+
+def collect_shards(
+    api_key: str, config: dict, windows: list[tuple[datetime, datetime]], engine: str,
+) -> list[tuple[list[dict], bool]]:
+    """Fetch every shard window of every category in parallel.
+
+    Results keep the order of ``windows``; each shard's items hold all
+    categories and its flag is False if any category came back incomplete.
+    """
+    categories = _categories(config)
+    queries = [
+        (category, build_params(config, end, begin, end))
+        for begin, end in windows
+        for category in categories
+    ]
+    if engine == "async":
+        results = asyncio.run(fetch_queries_async(api_key, config, queries))
+    else:
+        concurrency = max(1, config.get("concurrency", 4))
+        shard_concurrency = max(1, config.get("backfill", {}).get("shard_concurrency", 2))
+        with (
+            create_session(config, shard_concurrency) as session,
+            ThreadPoolExecutor(max_workers=shard_concurrency) as pool,
+        ):
+            futures = [
+                pool.submit(
+                    _fetch_window, session, _category_url(api_key, category), params, concurrency,
+                    split=config.get("window_split"),
+                )
+                for category, params in queries
+            ]
+            results = [future.result() for future in futures]
+        for (category, _), (items, _) in zip(queries, results):
+            _tag_category(items, category)
+
+    per_shard = len(categories)
+    return [
+        (
+            [item for items, _ in results[idx:idx + per_shard] for item in items],
+            all(ok for _, ok in results[idx:idx + per_shard]),
+        )
+        for idx in range(0, len(results), per_shard)
+    ]
+
+
+def backfill(
+    api_key: str, config: dict, keywords: list[str] | dict[str, str], start: datetime, end: datetime,
+    engine: str, output_dir: Path, shard_hours: int = 24, report: str = "merged",
+    store: sqlite3.Connection | None = None,
+) -> list[Path]:
+    """Rebuild reports for [start, end] (whole days) from per-shard inquiry windows.
+
+    ``report`` is "merged" for one workbook covering the range or "daily" for
+    one workbook per calendar day.
+    """
+    if shard_hours < 1:
+        raise ValueError(f"백필 구간 크기(shard_hours)는 1시간 이상이어야 합니다: {shard_hours}")
+    search_period = config.get("search_period", {})
+    start_hour = search_period.get("start_hour", "0000")
+    end_hour = search_period.get("end_hour", "2359")
+
+    def at(day: datetime, hour: str) -> datetime:
+        return datetime.strptime(f"{day:%Y%m%d}{hour}", "%Y%m%d%H%M").replace(tzinfo=KST)
+
+    range_begin, range_end = at(start, start_hour), at(end, end_hour)
+    if (start_hour, end_hour) == ("0000", "2359"):
+        windows = shard_windows(range_begin, range_end, shard_hours)
+    else:
+        # A narrower search_period leaves out the same hours a daily run would.
+        windows = []
+        day = start
+        while day.date() <= end.date():
+            windows.extend(shard_windows(at(day, start_hour), at(day, end_hour), shard_hours))
+            day += timedelta(days=1)
+    logger.info(
+        "백필: %s ~ %s, %d시간 단위 %d개 구간",
+        range_begin.strftime("%Y-%m-%d %H:%M"), range_end.strftime("%Y-%m-%d %H:%M"),
+        shard_hours, len(windows),
+    )
+
+    by_day: dict[str, list[BidNotice]] = {}
+    failed = 0
+    for (shard_begin, _), (items, complete) in zip(windows, collect_shards(api_key, config, windows, engine)):
+        if not complete:
+            failed += 1
+            logger.warning("구간 %s 조회가 완료되지 않았습니다.", shard_begin.strftime("%Y-%m-%d %H:%M"))
+        if store is not None and items:
+            upsert_notices(store, items)
+        shard_day = shard_begin.strftime("%Y%m%d")
+        for notice in to_notices(items):
+            day = notice.bidNtceDt.strftime("%Y%m%d") if notice.bidNtceDt else shard_day
+            by_day.setdefault(day, []).append(notice)
+    if failed:
+        logger.warning("%d개 구간이 불완전합니다. 같은 기간으로 다시 실행하세요.", failed)
+
+    if report == "daily":
+        groups = sorted(by_day.items())
+    else:
+        merged = merge_items([], [notice for notices in by_day.values() for notice in notices], "")
+        label = f"{start:%Y%m%d}-{end:%Y%m%d}"
+        groups = [(label, merged)] if merged else []
+
+    seen = _load_seen_set(config)
+    paths = []
+    for label, items in groups:
+        logger.info("%s: %d건", label, len(items))
+        filtered = build_report(items, keywords, config, seen)
+        paths.extend(write_outputs(filtered, end, output_dir, config, date_str=label))
+    if not paths:
+        logger.info("조회된 공고가 없어 엑셀을 생성하지 않습니다.")
+    _save_seen_set(config, seen)
+    return paths
+
+
+def _parse_date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y%m%d").replace(tzinfo=KST)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜는 YYYYMMDD 형식이어야 합니다: {value}")
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수여야 합니다: {value}")
+    return number
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="나라장터 용역 입찰공고 수집기")
+    parser.add_argument(
+        "--engine", choices=["sync", "async"],
+        help="API 호출 엔진 (기본값: config.json의 engine, 없으면 sync)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="페이지를 받는 즉시 필터링해 엑셀에 기록 (메모리 사용량 일정, 항상 전체 기간 조회)",
+    )
+    parser.add_argument(
+        "--full", action="store_true",
+        help="증분 체크포인트를 무시하고 days_back 전체 기간을 다시 조회",
+    )
+    parser.add_argument(
+        "--backfill", nargs=2, type=_parse_date, metavar=("START", "END"),
+        help="START~END(YYYYMMDD) 기간을 구간별로 나눠 병렬 조회",
+    )
+    parser.add_argument(
+        "--shard-hours", type=_positive_int,
+        help="백필 구간 크기(시간, 기본값: config.json의 backfill.shard_hours, 없으면 24)",
+    )
+    parser.add_argument(
+        "--report", choices=["merged", "daily"],
+        help="백필 결과를 하나로 합칠지(merged) 날짜별로 나눌지(daily)",
+    )
+    parser.add_argument(
+        "--search", metavar="QUERY",
+        help="API를 호출하지 않고 저장된 공고(store)의 공고명에서 QUERY를 검색",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=100,
+        help="--search 결과 최대 건수 (기본값: 100)",
+    )
+    return parser.parse_args(argv)
+
+
+def run_search(config: dict, query: str, limit: int) -> None:
+    store_path = _store_path(config)
+    if store_path is None or not store_path.exists():
+        logger.error("검색하려면 config.json의 store를 켜고 한 번 이상 수집해야 합니다.")
+        return
+    with closing(open_store(store_path)) as store:
+        started = time.perf_counter()
+        results = search_notices(store, query, limit)
+        elapsed = (time.perf_counter() - started) * 1000
+    logger.info("검색어 '%s': %d건 (%.1fms)", query, len(results), elapsed)
+    for item in results:
+        print("\t".join([
+            item.get("bidNtceDt") or "",
+            f"{item.get('bidNtceNo') or ''}-{item.get('bidNtceOrd') or ''}",
+            item.get("ntceInsttNm") or "",
+            item.get("bidNtceNm") or "",
+        ]))
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    config = load_config()
+    if args.search:
+        run_search(config, args.search, args.limit)
+        return
+    api_key = get_api_key()
+    configure_fetch(config)
+    engine = args.engine or config.get("engine", "sync")
+    keywords = config.get("keywords", ["조사", "연구"])
+    output_dir = Path(__file__).parent / "output"
+
+    store_path = _store_path(config)
+    with closing(open_store(store_path)) if store_path is not None else nullcontext() as store:
+        if args.backfill:
+            backfill_config = config.get("backfill", {})
+            start, end = args.backfill
+            paths = backfill(
+                api_key, config, keywords, start, end, engine, output_dir,
+                shard_hours=args.shard_hours or backfill_config.get("shard_hours", 24),
+                report=args.report or backfill_config.get("report", "merged"),
+                store=store,
+            )
+            for filepath in paths:
+                logger.info("완료. 파일: %s", filepath)
+            return
+
+        # Use today in KST
+        target_date = datetime.now(KST)
+        logger.info("조회 대상일: %s", target_date.strftime("%Y-%m-%d"))
+        logger.info("검색어: %s", keywords)
+
+        if args.stream or config.get("streaming", False):
+            filepath = run_streaming(api_key, config, keywords, target_date, output_dir, store)
+            if filepath is not None:
+                logger.info("완료. 파일: %s", filepath)
+            return
+        if config.get("incremental", False):
+            items = collect_incremental(api_key, config, target_date, engine, full=args.full, store=store)
+        else:
+            on_page = partial(upsert_notices, store) if store is not None else None
+            items, _ = collect_bids(api_key, config, target_date, engine, on_page=on_page)
+
+    if not items:
+        logger.info("조회된 공고가 없어 엑셀을 생성하지 않습니다.")
+        return
+
+    seen = _load_seen_set(config)
+    filtered = build_report(items, keywords, config, seen)
+    total_matched = sum(len(v) for v in filtered.values())
+
+    if total_matched == 0:
+        logger.info("검색어에 매칭되는 공고가 없습니다.")
+
+    for filepath in write_outputs(filtered, target_date, output_dir, config):
+        logger.info("완료. 파일: %s", filepath)
+    # Only remember what was seen once the reports are safely written.
+    _save_seen_set(config, seen)
 
 
 if __name__ == "__main__":